@@ -0,0 +1,84 @@
+import argparse
+import itertools
+import random
+import sys
+
+from league_table import LeagueTable, best_position, worst_position
+
+# Small enough for every result of the games left to be tried, 3 ** MAX_GAMES_LEFT of them per league
+MAX_TEAMS = 8
+MAX_GAMES_LEFT = 8
+
+
+def random_league(shuffle):
+    # (matches, remaining) for a few teams part way through a season, with scores low enough that teams
+    # often end up level on points, goal difference and goals scored
+    teams = [f"Team {i + 1}" for i in range(shuffle.randint(3, MAX_TEAMS))]
+    pairs = [[home, away] for home in teams for away in teams if home != away]
+    shuffle.shuffle(pairs)
+    left = shuffle.randint(1, min(MAX_GAMES_LEFT, len(pairs) - len(teams)))
+    played = pairs[left:]
+    matches = [[home, [shuffle.randint(0, 3), shuffle.randint(0, 3)], away] for home, away in played]
+    return matches, pairs[:left]
+
+
+def every_finish(matches, remaining):
+    # Every team's (best, worst) finish by trying every result of the games left. Level on points, a team
+    # with a game left could still win or lose the tie on goal difference, so it goes whichever way the
+    # case wants; otherwise goal difference, then goals scored, then the case decides
+    table = LeagueTable(matches)
+    fixtures = table.fixtures(remaining)
+    teams = range(len(table.teams))
+    has_games = [any(team in game for game in fixtures) for team in teams]
+    record = [(table.goal_difference[team], table.goals_scored[team]) for team in teams]
+
+    def above(team, other, points, best_case):
+        # Whether other finishes above team
+        if points[other] != points[team]:
+            return points[other] > points[team]
+        if has_games[team] or has_games[other]:
+            return not best_case
+        return record[other] > record[team] or (record[other] == record[team] and not best_case)
+
+    best = [len(table.teams)] * len(table.teams)
+    worst = [1] * len(table.teams)
+    for results in itertools.product(((3, 0), (1, 1), (0, 3)), repeat=len(fixtures)):
+        points = list(table.points)
+        for (home, away), (home_points, away_points) in zip(fixtures, results):
+            points[home] += home_points
+            points[away] += away_points
+        for team in teams:
+            others = [other for other in teams if other != team]
+            best[team] = min(best[team], 1 + sum(above(team, other, points, True) for other in others))
+            worst[team] = max(worst[team], 1 + sum(above(team, other, points, False) for other in others))
+    return table, fixtures, list(zip(best, worst))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Checks the finishing position searches against trying every "
+                                                 "result of the games left, on small random leagues")
+    parser.add_argument("--leagues", type=int, default=1000, help="random leagues to check")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random leagues")
+    args = parser.parse_args()
+
+    shuffle = random.Random(args.seed)
+    wrong = 0
+    for league in range(1, args.leagues + 1):
+        matches, remaining = random_league(shuffle)
+        table, fixtures, expected = every_finish(matches, remaining)
+        for team, finish in enumerate(expected):
+            found = (best_position(table, team, fixtures), worst_position(table, team, fixtures))
+            if found != finish:
+                wrong += 1
+                print(f"[!] League {league}: {table.teams[team]} can finish {finish[0]}-{finish[1]}, but the "
+                      f"search says {found[0]}-{found[1]}\n    matches: {matches}\n    remaining: {remaining}")
+        if league % 100 == 0:
+            print(f"{league} leagues checked", flush=True)
+    if wrong:
+        print(f"[!] {wrong} finishes were wrong")
+        sys.exit(1)
+    print(f"Every finish in {args.leagues} leagues matched")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import argparse
+import sys
+import time
+
+from example_data import EXAMPLE_MATCHES, EXAMPLE_REMAINING
+from league_table import LeagueTable, best_position, worst_position
+
+# Seconds every team's best and worst finish may take between them, searched one after another in this
+# process, at any point of the example season
+TIME_LIMIT = 10.0
+
+
+def season_slice(played):
+    # The example season as it stood after its first `played` matches, with the rest still to play
+    matches = EXAMPLE_MATCHES[:played]
+    remaining = [[home, away] for home, _, away in EXAMPLE_MATCHES[played:]] + EXAMPLE_REMAINING
+    return matches, remaining
+
+
+def time_searches(matches, remaining):
+    # Seconds taken by all the searches, and the slowest one as (seconds, team, "best" or "worst")
+    table = LeagueTable(matches)
+    fixtures = table.fixtures(remaining)
+    total = 0.0
+    slowest = (0.0, None, None)
+    for team in range(len(table.teams)):
+        for case, search in (("best", best_position), ("worst", worst_position)):
+            started = time.perf_counter()
+            search(table, team, fixtures)
+            seconds = time.perf_counter() - started
+            total += seconds
+            slowest = max(slowest, (seconds, table.teams[team], case), key=lambda timed: timed[0])
+    return total, slowest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Times the finishing position searches at every point of the "
+                                                 "example season, and fails if any of them takes too long")
+    parser.add_argument("--limit", type=float, default=TIME_LIMIT,
+                        help="seconds all the searches may take at any one point of the season")
+    parser.add_argument("--step", type=int, default=1, help="matches played between the points checked")
+    args = parser.parse_args()
+
+    too_slow = []
+    for played in range(len(EXAMPLE_MATCHES), -1, -args.step):
+        matches, remaining = season_slice(played)
+        total, (seconds, team, case) = time_searches(matches, remaining)
+        flag = "" if total <= args.limit else "  [!] over the limit"
+        print(f"{played:>3} played, {len(remaining):>3} left: {total:6.2f}s, slowest {team} {case} "
+              f"{seconds:.2f}s{flag}", flush=True)
+        if total > args.limit:
+            too_slow.append(played)
+    if too_slow:
+        print(f"[!] {len(too_slow)} points of the season took longer than {args.limit}s: "
+              f"{', '.join(map(str, too_slow))} matches played")
+        sys.exit(1)
+    print(f"Every point of the season took at most {args.limit}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import argparse
+import time
+
+import requests
+
+from cache_store import CACHE_DIR, CIRCUIT_OPEN_HEADER, STORE_BACKENDS
+from sofascore_client import SofascoreClient, retry_after_seconds, run_in_terminal
+
+
+class Warmer:
+    # Walks the endpoints the analysis scripts use, reading whatever is already cached and fetching the
+    # rest through the proxy - so a crawl that is stopped part way resumes where it left off
+    def __init__(self, client):
+        self.client = client
+        self.cached = 0
+
+    def get_json(self, path):
+        # None for anything the proxy couldn't get, e.g. a player without attribute overviews
+        downloads = self.client.downloads
+        try:
+            while True:
+                try:
+                    return self.client.get_json(path)
+                except requests.HTTPError as e:
+                    response = e.response
+                    if CIRCUIT_OPEN_HEADER not in response.headers:
+                        print(f"Couldn't fetch {path} ({response.status_code})")
+                        return None
+                    # The proxy has paused upstream traffic after a 403
+                    pause = retry_after_seconds(response) or self.client.max_backoff
+                    print(f"Proxy is paused, waiting {pause:.0f}s before retrying {path}")
+                    time.sleep(pause)
+        finally:
+            if self.client.downloads == downloads:
+                self.cached += 1
+
+    def warm_league(self, league_name):
+        league_name = league_name.replace(" ", "%20")
+        leagueid = self.get_json(f"api/v1/search/all?q={league_name}&page=0")['results'][0]['entity']['id']
+        seasonid = self.get_json(f"api/v1/unique-tournament/{leagueid}/seasons")['seasons'][0]['id']
+        season = f"api/v1/unique-tournament/{leagueid}/season/{seasonid}"
+
+        teams = self.get_json(f"{season}/standings/total")['standings'][0]['rows']
+        rounds = (len(teams) - 1) * 2
+        events = []
+        for i in range(1, rounds + 1):
+            round_data = self.get_json(f"{season}/events/round/{i}")
+            if round_data is not None:
+                events.extend(round_data['events'])
+
+        playerids = []
+        for team in teams:
+            squad = self.get_json(f"api/v1/team/{team['team']['id']}/players")
+            if squad is not None:
+                playerids.extend(player['player']['id'] for player in squad['players'])
+
+        for event in events:
+            # Pre-game form is cached forever, so only once the match is over (status code 100); fetched
+            # any earlier it would freeze the form as it stood on the day of the crawl
+            if event['status']['code'] == 100:
+                self.get_json(f"api/v1/event/{event['id']}/pregame-form")
+        for playerid in playerids:
+            self.get_json(f"api/v1/player/{playerid}/attribute-overviews")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crawl a league into the cache ahead of running the analysis scripts")
+    parser.add_argument("league", help="league name, as typed into the scripts")
+    parser.add_argument("--rate", type=int, default=30, help="requests per minute sent to the proxy (0 for no limit)")
+    parser.add_argument("--backend", default="file", choices=list(STORE_BACKENDS),
+                        help="cache backend the proxy is running with")
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    args = parser.parse_args()
+
+    print(f"The caching proxy needs to be running:\n{run_in_terminal}")
+    # One request at a time, so the crawl goes in order and a pause holds up nothing else
+    client = SofascoreClient("proxy", cache_dir=args.cache_dir, workers=1, rate_per_minute=args.rate,
+                             backend=args.backend)
+    warmer = Warmer(client)
+    try:
+        warmer.warm_league(args.league)
+    finally:
+        client.close()
+        print(f"Done: {client.downloads} fetched, {warmer.cached} already cached")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1055 @@
+import argparse
+import atexit
+import gzip
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import re
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:
+    # Windows, which locks files with msvcrt instead
+    fcntl = None
+    import msvcrt
+
+CACHE_DIR = "./cache"
+
+PROXY_PREFIX = "http://localhost:8080/"
+UPSTREAM_PREFIX = "http://www.sofascore.com/"
+# Set by the proxy on the 503 it answers with while its circuit breaker is open, so clients can tell it
+# from a 503 that came from sofascore
+CIRCUIT_OPEN_HEADER = "X-Cache-Circuit-Open"
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# URL path pattern, seconds before an entry is refetched (None keeps it forever), and whether the
+# entry becomes immutable once every event in it has status code 100 (finished)
+FRESHNESS_RULES = [
+    (re.compile(r"/event/\d+/pregame-form$"), None, False),
+    (re.compile(r"/events/round/\d+$"), 15 * MINUTE, True),
+    (re.compile(r"/standings/total$"), HOUR, False),
+    (re.compile(r"/unique-tournament/\d+/seasons$"), DAY, False),
+    (re.compile(r"/team/\d+/players$"), DAY, False),
+    (re.compile(r"/player/\d+/attribute-overviews$"), 7 * DAY, False),
+    (re.compile(r"/search/"), 7 * DAY, False),
+]
+# Anything that matches no rule is cached forever
+
+
+def freshness_rule(url: str):
+    path = urlsplit(url).path
+    for pattern, ttl, immutable_when_finished in FRESHNESS_RULES:
+        if pattern.search(path):
+            return ttl, immutable_when_finished
+    return None, False
+
+
+# Written by pack_cache and read by PackReader
+PACK_DATA = "pack.dat"
+PACK_INDEX = "pack.idx"
+# Held by pack_cache while it runs
+PACK_LOCK = "pack.lock"
+
+# Appended to by the proxy and read_cached_json, read back by evict_cache
+ACCESS_LOG = "access.log"
+
+# The old flat layout: the whole URL sanitised into a single filename
+LEGACY_UNSAFE = r'[<>:"/\\|?*\s]'
+
+# Every endpoint the scripts request, used to recover URLs from flat filenames
+LEGACY_URL_TEMPLATES = [
+    "api/v1/search/all?q={q}&page=0",
+    "api/v1/search/player-team-persons?q={q}&page=0",
+    "api/v1/unique-tournament/{id}/seasons",
+    "api/v1/unique-tournament/{id}/season/{id}/events/round/{id}",
+    "api/v1/unique-tournament/{id}/season/{id}/standings/total",
+    "api/v1/team/{id}/players",
+    "api/v1/player/{id}/attribute-overviews",
+    "api/v1/event/{id}/pregame-form",
+]
+
+
+def normalise_url(url: str) -> str:
+    # The proxy sees upstream URLs, the scripts use the local ones - both must share a key
+    return url.replace(UPSTREAM_PREFIX, PROXY_PREFIX)
+
+
+def url_to_key(url: str) -> str:
+    return hashlib.sha256(normalise_url(url).encode("utf-8")).hexdigest()
+
+
+def key_to_filename(key: str, cache_dir: str = CACHE_DIR) -> str:
+    # Two levels of 256 shards keep every directory small
+    return os.path.join(cache_dir, key[:2], key[2:4], f"{key}.bin").replace("\\", "/")
+
+
+def url_to_filename(url: str, cache_dir: str = CACHE_DIR) -> str:
+    return key_to_filename(url_to_key(url), cache_dir)
+
+
+def legacy_filename(url: str) -> str:
+    return re.sub(LEGACY_UNSAFE, '-', normalise_url(url)) + ".bin"
+
+
+def _template_to_regex(template):
+    pattern = re.escape(re.sub(LEGACY_UNSAFE, '-', PROXY_PREFIX))
+    for part in re.split(r"(\{id\}|\{q\})", template):
+        if part == "{id}":
+            pattern += r"(\d+)"
+        elif part == "{q}":
+            pattern += r"(.+)"
+        else:
+            pattern += re.escape(re.sub(LEGACY_UNSAFE, '-', part))
+    return re.compile(pattern + r"\.bin")
+
+
+LEGACY_PATTERNS = [(_template_to_regex(template), template) for template in LEGACY_URL_TEMPLATES]
+
+
+def legacy_name_to_url(name: str):
+    for pattern, template in LEGACY_PATTERNS:
+        match = pattern.fullmatch(name)
+        if match:
+            values = iter(match.groups())
+            path = re.sub(r"\{id\}|\{q\}", lambda _: next(values), template)
+            return PROXY_PREFIX + path
+    return None
+
+
+def migrate_flat_cache(cache_dir: str = CACHE_DIR):
+    moved = 0
+    unmatched = []
+    if not os.path.isdir(cache_dir):
+        return moved, unmatched
+    store = FileStore(cache_dir)
+    for name in os.listdir(cache_dir):
+        old_path = os.path.join(cache_dir, name)
+        if not name.endswith(".bin") or not os.path.isfile(old_path):
+            continue
+        url = legacy_name_to_url(name)
+        if url is None:
+            unmatched.append(name)
+            continue
+        new_path = url_to_filename(url, cache_dir)
+        os.makedirs(os.path.dirname(new_path), exist_ok=True)
+        if os.path.exists(new_path):
+            # Already fetched under the new layout, which is the more recent copy
+            os.remove(old_path)
+        else:
+            # The URL only survives in the old filename, so it goes into the metadata beside the moved body,
+            # fetched when the file was last written. Kept forever as it was, unless its rule refetches it
+            with open(old_path, "rb") as f:
+                body = f.read()
+            ttl, _ = freshness_rule(url)
+            store.write_meta(new_path, CacheEntry(normalise_url(url), body, 200, {}, os.path.getmtime(old_path),
+                                                  immutable=ttl is None))
+            os.replace(old_path, new_path)
+        moved += 1
+    store.close()
+    return moved, unmatched
+
+
+def write_atomically(filename: str, content: bytes):
+    # Readers see either the old file or the whole new one, never a truncated write
+    handle, temp_filename = tempfile.mkstemp(dir=os.path.dirname(filename), suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as f:
+            f.write(content)
+        os.replace(temp_filename, filename)
+    except BaseException:
+        os.remove(temp_filename)
+        raise
+
+
+# Formats bodies can be kept in at rest, mapped to their Content-Encoding ("" is uncompressed)
+COMPRESSIONS = {"none": "", "gzip": "gzip", "zstd": "zstd"}
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    if encoding == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd compression needs the zstandard package (pip install zstandard)")
+        return zstandard.ZstdCompressor().compress(body)
+    return body
+
+
+def decompress(body, encoding: str):
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "zstd":
+        if zstandard is None:
+            raise RuntimeError("This cache holds zstd entries, which need the zstandard package (pip install zstandard)")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    return body
+
+
+# What reading a truncated or corrupt cached body can raise, from decompressing it to parsing it
+CORRUPT_BODY_ERRORS = (ValueError, EOFError, OSError, zlib.error) + ((zstandard.ZstdError,) if zstandard else ())
+
+
+def parse_json(body):
+    # orjson when it is installed, which also takes the pack's memoryviews as they are
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(bytes(body))
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    body: bytes
+    status: int = 200
+    headers: dict = field(default_factory=dict)
+    fetched_at: float = field(default_factory=time.time)
+    # Set once the resource can no longer change, e.g. a round where every match has finished
+    immutable: bool = False
+    # Content-Encoding the body is stored in
+    encoding: str = ""
+
+    def decoded_body(self) -> bytes:
+        return decompress(self.body, self.encoding)
+
+
+# Known-missing resources, cached with their own lifetime so they aren't asked for on every run
+NEGATIVE_STATUSES = {404, 410}
+
+
+def is_fresh(entry: CacheEntry, negative_ttl: int = DAY) -> bool:
+    # Whether the proxy would serve the entry as it is rather than go upstream for it
+    if entry.status in NEGATIVE_STATUSES:
+        return time.time() - entry.fetched_at < negative_ttl
+    if entry.immutable:
+        return True
+    ttl, _ = freshness_rule(entry.url)
+    return ttl is None or time.time() - entry.fetched_at < ttl
+
+
+def meta_is_fresh(url: str, meta: dict) -> bool:
+    # is_fresh for an entry's stored metadata, without its body
+    return is_fresh(CacheEntry(url, b"", meta["status"], meta.get("headers", {}), meta["fetched_at"],
+                               meta.get("immutable", False)))
+
+
+# Headers that describe the upstream transfer rather than the stored body
+SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+
+
+def headers_to_store(headers) -> dict:
+    return {name.lower(): value for name, value in headers.items() if name.lower() not in SKIPPED_HEADERS}
+
+
+def pack_data_name(generation: int) -> str:
+    # Generation 0 is the original pack.dat; each eviction that drops packed entries writes the next one
+    return PACK_DATA if generation == 0 else f"pack.{generation}.dat"
+
+
+@dataclass
+class StoredItem:
+    # What eviction needs to know about one cached response, without its body
+    key: str
+    url: str
+    size: int
+    immutable: bool
+    last_used: float
+    uses: int = 0
+    loose: bool = False
+    packed: bool = False
+
+
+def note_access(accesses: dict, url: str):
+    # Buffers a cache read as url -> (last access, reads) until it is flushed with record_access
+    previous = accesses.get(url)
+    accesses[url] = (time.time(), (previous[1] if previous else 0) + 1)
+
+
+def read_access_log(cache_dir: str = CACHE_DIR) -> dict:
+    # key -> [last access, reads], summed over every line appended for it
+    accesses = {}
+    try:
+        with open(os.path.join(cache_dir, ACCESS_LOG), "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) != 3:
+                    continue
+                key, last, count = parts[0], float(parts[1]), int(parts[2])
+                seen = accesses.setdefault(key, [0.0, 0])
+                seen[0] = max(seen[0], last)
+                seen[1] += count
+    except FileNotFoundError:
+        pass
+    return accesses
+
+
+def write_access_log(cache_dir: str, accesses: dict):
+    # Replaces the log with one line per key; reads appended while this runs are lost, which only costs counts
+    lines = "".join(f"{key} {last:.0f} {count}\n" for key, (last, count) in accesses.items())
+    write_atomically(os.path.join(cache_dir, ACCESS_LOG), lines.encode("utf-8"))
+
+
+class PackReader:
+    # Entries compacted by pack_cache: one append-only data file, memory-mapped, and a sorted index of
+    # (SHA-256 digest, offset, metadata length, body length) records that is binary searched.
+    # The index starts with a header naming the generation of data file its offsets point into.
+    # The proxy reads from its event loop while its writer thread reopens the pack after eviction, hence
+    # the lock
+    HEADER = struct.Struct(">4sQ")
+    MAGIC = b"SCPK"
+    RECORD = struct.Struct(">32sQII")
+
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, PACK_INDEX)
+        self.generation = 0
+        self.data_path = os.path.join(cache_dir, PACK_DATA)
+        self.index = b""
+        self.data = None
+        self.data_file = None
+        self.version = None
+        self.lock = threading.RLock()
+        self.open()
+
+    def _index_version(self):
+        try:
+            stat = os.stat(self.index_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def open(self):
+        with self.lock:
+            self.close()
+            self.version = self._index_version()
+            if self.version is None:
+                return
+            # The index is read whole rather than mapped, so pack_cache can replace it while we are open
+            with open(self.index_path, "rb") as f:
+                index = f.read()
+            self.generation = 0
+            # Indexes written before compaction existed have no header and always point into pack.dat
+            if len(index) % self.RECORD.size == self.HEADER.size and index.startswith(self.MAGIC):
+                self.generation = self.HEADER.unpack_from(index)[1]
+                index = index[self.HEADER.size:]
+            self.index = index
+            self.data_path = os.path.join(self.cache_dir, pack_data_name(self.generation))
+            try:
+                self.data_file = open(self.data_path, "rb")
+            except FileNotFoundError:
+                # Compacted away between reading the index and opening it. Empty until the next refresh,
+                # which finds the index that replaced this one
+                self.index = b""
+                self.version = None
+                return
+            if os.fstat(self.data_file.fileno()).st_size:
+                self.data = mmap.mmap(self.data_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def refresh(self) -> bool:
+        # Picks up a pack written since we opened it
+        with self.lock:
+            if self._index_version() == self.version:
+                return False
+            self.open()
+            return True
+
+    def close(self):
+        with self.lock:
+            if self.data is not None:
+                try:
+                    self.data.close()
+                except BufferError:
+                    # A body read from it is still in use; the mapping goes once the last of them does
+                    pass
+            if self.data_file is not None:
+                self.data_file.close()
+            self.index = b""
+            self.data = None
+            self.data_file = None
+
+    def __len__(self):
+        return len(self.index) // self.RECORD.size
+
+    def record(self, i):
+        return self.RECORD.unpack_from(self.index, i * self.RECORD.size)
+
+    def find(self, key: str):
+        digest = bytes.fromhex(key)
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self.index[middle * self.RECORD.size:middle * self.RECORD.size + 32] < digest:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self) and self.record(low)[0] == digest:
+            return self.record(low)[1:]
+        return None
+
+    def read(self, key: str, parsed: bool = False):
+        # (metadata, body) with the body a zero-copy slice of the mapped pack. With parsed, also the
+        # marshalled parse pack_cache stores after a JSON body, or None for an entry without one
+        with self.lock:
+            location = self.find(key)
+            if location is None or self.data is None:
+                return None
+            offset, meta_length, body_length = location
+            view = memoryview(self.data)
+        meta = json.loads(bytes(view[offset:offset + meta_length]))
+        end = offset + meta_length + body_length
+        if not parsed:
+            return meta, view[offset + meta_length:end]
+        return meta, view[offset + meta_length:end], view[end:end + meta["parsed"]] if meta.get("parsed") else None
+
+    def items(self):
+        for i in range(len(self)):
+            key = self.record(i)[0].hex()
+            yield key, self.read(key)
+
+
+class FileStore:
+    # Body in <key>.bin (what the scripts read directly), everything else in <key>.meta, and
+    # older entries folded into the pack by pack_cache
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.pack = PackReader(cache_dir)
+
+    def _meta_filename(self, filename):
+        return filename[:-len(".bin")] + ".meta"
+
+    def read_loose(self, filename):
+        try:
+            with open(filename, "rb") as f:
+                body = f.read()
+        except FileNotFoundError:
+            body = None
+        try:
+            with open(self._meta_filename(filename), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            if body is None:
+                return None
+            # Written before metadata was kept: a 200 fetched when the file was
+            meta = {"status": 200, "headers": {}, "fetched_at": os.path.getmtime(filename)}
+        if body is None:
+            # Error bodies only live in the metadata
+            if "body" not in meta:
+                return None
+            body = meta.pop("body").encode("utf-8")
+        elif "crc32" in meta and (len(body) != meta["size"] or zlib.crc32(body) != meta["crc32"]):
+            # The body and metadata are written one after the other, so this is a body read before its
+            # metadata was written, or left that way by a crash. Read as a miss, so it is fetched again
+            return None
+        return meta, body
+
+    def _lookup(self, key):
+        # (metadata, body, stored parse or None) of the newest copy. A stat picks up a pack written since
+        # we opened it, which may hold a newer copy than ours or have taken in the loose files
+        self.pack.refresh()
+        packed = self.pack.read(key, parsed=True)
+        if packed is not None:
+            meta = packed[0]
+            # The proxy only refetches what has expired, so a 200 still fresh in the pack can't have a newer
+            # loose copy, and is read without looking for one
+            if meta.get("immutable", False) or (meta["status"] == 200 and "url" in meta
+                                                 and meta_is_fresh(meta["url"], meta)):
+                return packed
+        loose = self.read_loose(key_to_filename(key, self.cache_dir))
+        if loose is not None:
+            return loose + (None,)
+        return packed
+
+    def read(self, url: str):
+        found = self._lookup(url_to_key(url))
+        return found[:2] if found is not None else None
+
+    def get(self, url: str):
+        found = self.read(url)
+        if found is None:
+            return None
+        meta, body = found
+        return CacheEntry(normalise_url(url), bytes(body), meta["status"], meta["headers"], meta["fetched_at"],
+                          meta.get("immutable", False), meta.get("encoding", ""))
+
+    def get_body(self, url: str):
+        # Just the uncompressed body of a cached 200, straight from the pack where possible
+        found = self.read(url)
+        if found is None or found[0]["status"] != 200:
+            return None
+        meta, body = found
+        return decompress(body, meta.get("encoding", ""))
+
+    def read_json(self, url: str, fresh_only: bool = False):
+        # The parsed body of a cached 200, or with fresh_only only one the proxy would still serve without
+        # going upstream. Packed entries carry the parse pack_cache stored with them in marshal format, so
+        # only loose entries have their JSON parsed
+        found = self._lookup(url_to_key(url))
+        if found is None or found[0]["status"] != 200:
+            return None
+        meta, body, parsed = found
+        if fresh_only and not meta_is_fresh(normalise_url(url), meta):
+            return None
+        if parsed is not None:
+            try:
+                return marshal.loads(parsed)
+            except (ValueError, EOFError, TypeError):
+                # A damaged parse; the body it was made from is still there
+                pass
+        return parse_json(decompress(body, meta.get("encoding", "")))
+
+    def put(self, entry: CacheEntry):
+        filename = url_to_filename(entry.url, self.cache_dir)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        if entry.status != 200:
+            # Error bodies only live in the metadata, so the scripts never read one as a cached result
+            if os.path.exists(filename):
+                os.remove(filename)
+            self.write_meta(filename, entry, entry.decoded_body().decode("utf-8", errors="replace"))
+            return
+        write_atomically(filename, entry.body)
+        self.write_meta(filename, entry)
+
+    def touch(self, entry: CacheEntry):
+        # Revalidated without a new body, so only the metadata changes - unless the body is only in the pack
+        filename = url_to_filename(entry.url, self.cache_dir)
+        if entry.status != 200 or not os.path.exists(filename):
+            self.put(entry)
+            return
+        self.write_meta(filename, entry)
+
+    def write_meta(self, filename, entry, body=None):
+        meta = {"url": normalise_url(entry.url), "status": entry.status, "headers": entry.headers,
+                "fetched_at": entry.fetched_at, "immutable": entry.immutable}
+        if body is not None:
+            meta["body"] = body
+        else:
+            # What read_loose checks the .bin against
+            meta["size"] = len(entry.body)
+            meta["crc32"] = zlib.crc32(entry.body)
+            if entry.encoding:
+                meta["encoding"] = entry.encoding
+        write_atomically(self._meta_filename(filename), json.dumps(meta).encode("utf-8"))
+
+    def delete(self, url: str):
+        # Only loose files; packed entries are dropped when the pack is rewritten
+        filename = url_to_filename(url, self.cache_dir)
+        for path in (filename, self._meta_filename(filename)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def iter_prefix(self, prefix: str):
+        # No index over URLs on disk, so this walks every metadata file and the whole pack
+        prefix = normalise_url(prefix)
+        self.pack.refresh()
+        seen = set()
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                if not name.endswith(".meta"):
+                    continue
+                with open(os.path.join(root, name), "r", encoding="utf-8") as f:
+                    url = json.load(f).get("url", "")
+                if url.startswith(prefix):
+                    seen.add(url)
+                    entry = self.get(url)
+                    if entry is not None:
+                        yield entry
+        for _, (meta, _) in self.pack.items():
+            url = meta.get("url", "")
+            if url.startswith(prefix) and url not in seen:
+                entry = self.get(url)
+                if entry is not None:
+                    yield entry
+
+    def record_access(self, accesses: dict):
+        # One append per batch; appends this small don't interleave between the proxy and the scripts
+        lines = "".join(f"{url_to_key(url)} {last:.0f} {count}\n" for url, (last, count) in accesses.items())
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(os.path.join(self.cache_dir, ACCESS_LOG), "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def usage(self):
+        # Every key with the bytes it takes up on disk, loose files and pack together
+        accesses = read_access_log(self.cache_dir)
+        # A reader of our own, as the proxy calls this from its writer thread while serving from self.pack
+        pack = PackReader(self.cache_dir)
+        items = {}
+        for key, filename, meta_filename in loose_entries(self.cache_dir):
+            try:
+                with open(meta_filename, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                meta = {"fetched_at": os.path.getmtime(filename) if os.path.exists(filename) else 0.0}
+            size = sum(os.path.getsize(path) for path in (filename, meta_filename) if os.path.exists(path))
+            items[key] = self._stored_item(key, meta, size, accesses, loose=True)
+        for i in range(len(pack)):
+            digest, offset, meta_length, body_length = pack.record(i)
+            key = digest.hex()
+            meta = json.loads(pack.data[offset:offset + meta_length])
+            size = meta_length + body_length + meta.get("parsed", 0)
+            if key in items:
+                items[key].size += size
+                items[key].packed = True
+                continue
+            items[key] = self._stored_item(key, meta, size, accesses, packed=True)
+        pack.close()
+        return list(items.values())
+
+    def _stored_item(self, key, meta, size, accesses, loose=False, packed=False):
+        last, uses = accesses.get(key, (0.0, 0))
+        return StoredItem(key, meta.get("url", key), size, meta.get("immutable", False),
+                          max(last, meta.get("fetched_at", 0.0)), uses, loose, packed)
+
+    def remove_items(self, items):
+        for item in items:
+            filename = key_to_filename(item.key, self.cache_dir)
+            for path in (filename, self._meta_filename(filename)):
+                if os.path.exists(path):
+                    os.remove(path)
+        dropped = {item.key for item in items}
+        packed = [item.key for item in items if item.packed]
+        if packed:
+            pack_cache(self.cache_dir, drop=packed, include_loose=False)
+            # Our own reader still has the old index, and the old data file mapped after it was deleted
+            self.pack.refresh()
+        accesses = read_access_log(self.cache_dir)
+        write_access_log(self.cache_dir, {key: seen for key, seen in accesses.items() if key not in dropped})
+
+    def close(self):
+        self.pack.close()
+
+
+def loose_entries(cache_dir: str = CACHE_DIR):
+    # (key, .bin path, .meta path) for every entry still stored as loose files
+    if not os.path.isdir(cache_dir):
+        return
+    for first in sorted(os.listdir(cache_dir)):
+        first_dir = os.path.join(cache_dir, first)
+        if len(first) != 2 or not os.path.isdir(first_dir):
+            continue
+        for second in sorted(os.listdir(first_dir)):
+            second_dir = os.path.join(first_dir, second)
+            keys = {name.split(".")[0] for name in os.listdir(second_dir)
+                    if name.endswith(".bin") or name.endswith(".meta")}
+            for key in sorted(keys):
+                filename = key_to_filename(key, cache_dir)
+                yield key, filename, filename[:-len(".bin")] + ".meta"
+
+
+def marshal_json(body, meta) -> bytes:
+    # A body's parsed JSON in marshal format, or b"" if it can't be stored that way
+    try:
+        return marshal.dumps(parse_json(decompress(body, meta.get("encoding", ""))))
+    except CORRUPT_BODY_ERRORS + (RuntimeError,):
+        # Not JSON, a truncated or corrupt body, one that won't decompress here, or a value marshal can't write
+        return b""
+
+
+class PackLock:
+    # An exclusive lock on the cache directory's pack, between processes as well as threads: the proxy
+    # packs from its writer thread when it evicts, while `python cache_store.py pack` or `evict` may be
+    # run alongside it
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        self.path = os.path.join(cache_dir, PACK_LOCK)
+        self.file = None
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.file = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+            return self
+        self.file.seek(0)
+        while True:
+            try:
+                msvcrt.locking(self.file.fileno(), msvcrt.LK_LOCK, 1)
+                return self
+            except OSError:
+                # LK_LOCK only retries for 10 seconds
+                pass
+
+    def __exit__(self, *exc_info):
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        else:
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+        self.file.close()
+        self.file = None
+
+
+def pack_cache(cache_dir: str = CACHE_DIR, drop=(), include_loose: bool = True):
+    # Appends every loose entry to the pack, rewrites the sorted index, then removes the loose files.
+    # A JSON body is followed by its parse, so reading it from the pack needs no parsing.
+    # Dropping packed entries copies the rest into the next generation's data file instead of appending,
+    # so a reader still holding the old index keeps reading the old file until it refreshes.
+    # Only one pack_cache runs at a time, or one could delete the data file another is appending to
+    with PackLock(cache_dir):
+        return _pack_locked(cache_dir, drop, include_loose)
+
+
+def _pack_locked(cache_dir, drop, include_loose):
+    store = FileStore(cache_dir)
+    pack = store.pack
+    drop = {bytes.fromhex(key) for key in drop}
+    locations = {}
+    for i in range(len(pack)):
+        digest, offset, meta_length, body_length = pack.record(i)
+        locations[digest] = (offset, meta_length, body_length)
+    compact = not drop.isdisjoint(locations)
+    generation = pack.generation + 1 if compact else pack.generation
+    old_data_path = pack.data_path
+
+    packed = []
+    with open(os.path.join(cache_dir, pack_data_name(generation)), "wb" if compact else "ab") as data:
+        if compact:
+            kept = {}
+            for digest, (offset, meta_length, body_length) in sorted(locations.items(), key=lambda item: item[1][0]):
+                if digest in drop:
+                    continue
+                kept[digest] = (data.tell(), meta_length, body_length)
+                parsed_length = json.loads(pack.data[offset:offset + meta_length]).get("parsed", 0)
+                data.write(pack.data[offset:offset + meta_length + body_length + parsed_length])
+            locations = kept
+        offset = data.tell()
+        for key, filename, meta_filename in (loose_entries(cache_dir) if include_loose else ()):
+            versions = {path: os.stat(path).st_mtime_ns for path in (filename, meta_filename) if os.path.exists(path)}
+            loose = store.read_loose(filename)
+            if loose is None:
+                continue
+            meta, body = loose
+            parsed = marshal_json(body, meta) if meta["status"] == 200 else b""
+            if parsed:
+                meta["parsed"] = len(parsed)
+            meta_bytes = json.dumps(meta).encode("utf-8")
+            data.write(meta_bytes)
+            data.write(body)
+            data.write(parsed)
+            locations[bytes.fromhex(key)] = (offset, len(meta_bytes), len(body))
+            offset += len(meta_bytes) + len(body) + len(parsed)
+            packed.append(versions)
+        data.flush()
+        os.fsync(data.fileno())
+    store.close()
+
+    index = [PackReader.HEADER.pack(PackReader.MAGIC, generation)]
+    index.extend(PackReader.RECORD.pack(digest, *locations[digest]) for digest in sorted(locations))
+    write_atomically(os.path.join(cache_dir, PACK_INDEX), b"".join(index))
+    if compact:
+        try:
+            os.remove(old_data_path)
+        except OSError:
+            # Still mapped by a reader on Windows; it's only disk space, so leave it
+            pass
+
+    for versions in packed:
+        for path, version in versions.items():
+            # Leave anything the proxy rewrote while we were packing for the next pack
+            if os.path.exists(path) and os.stat(path).st_mtime_ns == version:
+                os.remove(path)
+    return len(packed)
+
+
+# One open store per (backend, cache directory), so the pack is only mapped once per process
+_readers = {}
+# Reads made by this process, recorded in each store's access history when it exits
+_accesses = {}
+
+
+def _reader(cache_dir, backend):
+    store = _readers.get((backend, cache_dir))
+    if store is None:
+        store = _readers[backend, cache_dir] = open_store(backend, cache_dir)
+        _accesses[backend, cache_dir] = {}
+    return store
+
+
+def read_cached_json(url: str, cache_dir: str = CACHE_DIR, fresh_only: bool = False, backend: str = "file"):
+    # For the scripts: the parsed body of a URL, or None if it has never been fetched successfully (or,
+    # with fresh_only, has expired under FRESHNESS_RULES). backend is the one the proxy stores into
+    data = _reader(cache_dir, backend).read_json(url, fresh_only)
+    if data is not None:
+        note_access(_accesses[backend, cache_dir], url)
+    return data
+
+
+@atexit.register
+def _flush_accesses():
+    for store_key, accesses in _accesses.items():
+        if accesses:
+            _readers[store_key].record_access(accesses)
+
+
+class SQLiteStore:
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        os.makedirs(cache_dir, exist_ok=True)
+        # Shared by the proxy's event loop (reads) and its background writer (writes)
+        self.db = sqlite3.connect(os.path.join(cache_dir, "responses.sqlite3"), check_same_thread=False)
+        self.lock = threading.Lock()
+        # WAL lets the scripts read while the proxy is writing
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                fetched_at REAL NOT NULL,
+                immutable INTEGER NOT NULL DEFAULT 0,
+                encoding TEXT NOT NULL DEFAULT '',
+                last_access REAL NOT NULL DEFAULT 0,
+                hits INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID""")
+        self._add_missing_columns()
+        self.db.commit()
+
+    def _add_missing_columns(self):
+        # Databases created by older versions of this file lack the newer columns
+        columns = {row[1] for row in self.db.execute("PRAGMA table_info(responses)")}
+        for column, definition in [("immutable", "INTEGER NOT NULL DEFAULT 0"), ("encoding", "TEXT NOT NULL DEFAULT ''"),
+                                   ("last_access", "REAL NOT NULL DEFAULT 0"), ("hits", "INTEGER NOT NULL DEFAULT 0")]:
+            if column not in columns:
+                self.db.execute(f"ALTER TABLE responses ADD COLUMN {column} {definition}")
+
+    def _row_to_entry(self, row):
+        url, status, headers, body, fetched_at, immutable, encoding = row
+        return CacheEntry(url, bytes(body), status, json.loads(headers), fetched_at, bool(immutable), encoding)
+
+    def get(self, url: str):
+        with self.lock:
+            row = self.db.execute("SELECT url, status, headers, body, fetched_at, immutable, encoding FROM responses "
+                                  "WHERE url = ?", (normalise_url(url),)).fetchone()
+        return self._row_to_entry(row) if row else None
+
+    def read_json(self, url: str, fresh_only: bool = False):
+        # As FileStore.read_json, parsing the row's body every time
+        entry = self.get(url)
+        if entry is None or entry.status != 200 or (fresh_only and not is_fresh(entry)):
+            return None
+        return parse_json(entry.decoded_body())
+
+    def put(self, entry: CacheEntry):
+        with self.lock:
+            # An upsert rather than INSERT OR REPLACE, so a refetch keeps the row's access history
+            self.db.execute("INSERT INTO responses "
+                            "(url, status, headers, body, fetched_at, immutable, encoding) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                            "ON CONFLICT(url) DO UPDATE SET status = excluded.status, headers = excluded.headers, "
+                            "body = excluded.body, fetched_at = excluded.fetched_at, immutable = excluded.immutable, "
+                            "encoding = excluded.encoding",
+                            (normalise_url(entry.url), entry.status, json.dumps(entry.headers), entry.body,
+                             entry.fetched_at, int(entry.immutable), entry.encoding))
+            self.db.commit()
+
+    def touch(self, entry: CacheEntry):
+        with self.lock:
+            self.db.execute("UPDATE responses SET headers = ?, fetched_at = ?, immutable = ? WHERE url = ?",
+                            (json.dumps(entry.headers), entry.fetched_at, int(entry.immutable),
+                             normalise_url(entry.url)))
+            self.db.commit()
+
+    def delete(self, url: str):
+        with self.lock:
+            self.db.execute("DELETE FROM responses WHERE url = ?", (normalise_url(url),))
+            self.db.commit()
+
+    def record_access(self, accesses: dict):
+        with self.lock:
+            self.db.executemany("UPDATE responses SET last_access = MAX(last_access, ?), hits = hits + ? WHERE url = ?",
+                                [(last, count, normalise_url(url)) for url, (last, count) in accesses.items()])
+            self.db.commit()
+
+    def usage(self):
+        with self.lock:
+            rows = self.db.execute("SELECT url, length(url) + length(headers) + length(body), immutable, "
+                                   "MAX(fetched_at, last_access), hits FROM responses").fetchall()
+        return [StoredItem(url, url, size, bool(immutable), last_used, hits)
+                for url, size, immutable, last_used, hits in rows]
+
+    def remove_items(self, items):
+        # Freed pages are reused by later writes, so the file stops growing rather than shrinking
+        with self.lock:
+            self.db.executemany("DELETE FROM responses WHERE url = ?", [(item.url,) for item in items])
+            self.db.commit()
+
+    def iter_prefix(self, prefix: str):
+        # A range over the primary key, e.g. every round of a season in one indexed scan
+        prefix = normalise_url(prefix)
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        with self.lock:
+            rows = self.db.execute("SELECT url, status, headers, body, fetched_at, immutable, encoding FROM responses "
+                                   "WHERE url >= ? AND url < ? ORDER BY url", (prefix, upper)).fetchall()
+        for row in rows:
+            yield self._row_to_entry(row)
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+class MemoryTier:
+    # LRU over whole entries, bounded by the bytes of the bodies it holds rather than a count.
+    # Filled from both the proxy's event loop and its background writer, hence the lock
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, url: str):
+        url = normalise_url(url)
+        with self.lock:
+            entry = self.entries.get(url)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(url)
+            self.hits += 1
+            return entry
+
+    def put(self, entry: CacheEntry):
+        url = normalise_url(entry.url)
+        with self.lock:
+            self._discard(url)
+            if len(entry.body) > self.budget_bytes:
+                return
+            self.entries[url] = entry
+            self.used_bytes += len(entry.body)
+            self._shrink()
+
+    def discard(self, url: str):
+        with self.lock:
+            self._discard(normalise_url(url))
+
+    def resize(self, budget_bytes: int):
+        with self.lock:
+            self.budget_bytes = budget_bytes
+            self._shrink()
+
+    def _discard(self, url):
+        entry = self.entries.pop(url, None)
+        if entry is not None:
+            self.used_bytes -= len(entry.body)
+
+    def _shrink(self):
+        while self.used_bytes > self.budget_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.used_bytes -= len(evicted.body)
+
+
+STORE_BACKENDS = {"file": FileStore, "sqlite": SQLiteStore}
+
+# Sort keys for eviction, first evicted first. Immutable entries sort after every mutable one, so a
+# finished round is only evicted once there is nothing left that could be refetched for fresher data
+EVICTION_POLICIES = {
+    "lru": lambda item: (item.immutable, item.last_used),
+    "lfu": lambda item: (item.immutable, item.uses, item.last_used),
+}
+
+
+def open_store(backend: str = "file", cache_dir: str = CACHE_DIR):
+    if backend not in STORE_BACKENDS:
+        raise ValueError(f"Unknown cache backend {backend!r}, expected one of {', '.join(STORE_BACKENDS)}")
+    return STORE_BACKENDS[backend](cache_dir)
+
+
+def evict_cache(store, max_bytes: int, policy: str = "lru", dry_run: bool = False):
+    # Removes entries in policy order until the store fits in max_bytes; returns (evicted, bytes left)
+    if policy not in EVICTION_POLICIES:
+        raise ValueError(f"Unknown eviction policy {policy!r}, expected one of {', '.join(EVICTION_POLICIES)}")
+    items = store.usage()
+    remaining = sum(item.size for item in items)
+    evicted = []
+    for item in sorted(items, key=EVICTION_POLICIES[policy]):
+        if remaining <= max_bytes:
+            break
+        evicted.append(item)
+        remaining -= item.size
+    if evicted and not dry_run:
+        store.remove_items(evicted)
+    return evicted, remaining
+
+
+def format_size(size: float) -> str:
+    for unit in ["B", "KB", "MB", "GB"]:
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def parse_size(text: str) -> int:
+    # "500M", "2G", "750k" or plain bytes
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+    text = text.strip().upper().removesuffix("B")
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def print_eviction_report(evicted, remaining, dry_run):
+    verb = "Would evict" if dry_run else "Evicted"
+    print(f"{verb} {len(evicted)} cached responses ({format_size(sum(item.size for item in evicted))}), "
+          f"leaving {format_size(remaining)}")
+    for item in evicted:
+        last_used = time.strftime("%Y-%m-%d %H:%M", time.localtime(item.last_used)) if item.last_used else "never"
+        flag = " immutable" if item.immutable else ""
+        print(f"  {format_size(item.size):>9}  used {last_used}  {item.uses:>4} reads{flag}  "
+              f"{item.url.removeprefix(PROXY_PREFIX)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintenance commands for the sofascore response cache")
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("migrate", help="move a flat pre-sharding cache into the hashed layout")
+    commands.add_parser("pack", help="fold loose cache files into the memory-mapped pack")
+    evict = commands.add_parser("evict", help="shrink the cache to a size budget")
+    evict.add_argument("max_size", type=parse_size, help="size to shrink to, e.g. 500M or 2G")
+    evict.add_argument("--policy", default="lru", choices=list(EVICTION_POLICIES))
+    evict.add_argument("--backend", default="file", choices=list(STORE_BACKENDS))
+    evict.add_argument("--dry-run", action="store_true", help="list what would be evicted without removing it")
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        moved, unmatched = migrate_flat_cache(args.cache_dir)
+        print(f"Migrated {moved} cached responses into {args.cache_dir}")
+        for name in unmatched:
+            print(f"[!] Could not recover the URL for {name}, leaving it in place")
+    elif args.command == "pack":
+        packed = pack_cache(args.cache_dir)
+        print(f"Packed {packed} cached responses into {os.path.join(args.cache_dir, PACK_INDEX)}")
+    elif args.command == "evict":
+        store = open_store(args.backend, args.cache_dir)
+        try:
+            evicted, remaining = evict_cache(store, args.max_size, args.policy, args.dry_run)
+        finally:
+            store.close()
+        print_eviction_report(evicted, remaining, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,71 +1,625 @@
-from mitmproxy import http
-import os
-import gzip
-from io import BytesIO
+from mitmproxy import ctx, exceptions, http
+from mitmproxy.net import encoding as http_encoding
+import asyncio
+import json
+import queue
 import re
+import threading
+import time
+from urllib.parse import urlsplit
 
-CACHE_DIR = "./cache"
+from cache_store import CACHE_DIR, CIRCUIT_OPEN_HEADER, COMPRESSIONS, DAY, EVICTION_POLICIES, MINUTE, NEGATIVE_STATUSES, CacheEntry, \
+    MemoryTier, STORE_BACKENDS, compress, evict_cache, format_size, freshness_rule, headers_to_store, is_fresh, \
+    migrate_flat_cache, normalise_url, note_access, open_store, url_to_filename, zstandard
 
 
-def url_to_filename(url: str) -> str:
-    url = url.replace("http://www.sofascore.com/", "http://localhost:8080/")
-    # Replace characters that are not safe in filenames
-    safe_filename = re.sub(r'[<>:"/\\|?*\s]', '-', url)
-    return os.path.join(CACHE_DIR, f"{safe_filename}.bin").replace("\\", "/")
+def all_events_finished(body: bytes) -> bool:
+    try:
+        events = json.loads(body)["events"]
+    except (ValueError, KeyError, TypeError):
+        return False
+    return len(events) > 0 and all(event["status"]["code"] == 100 for event in events)
 
 
-def load_from_cache(filename: str) -> bytes:
-    with open(filename, "rb") as f:
-        return f.read()
+# Longest error body kept for a negative entry
+NEGATIVE_BODY_LIMIT = 1024
 
 
-def save_to_cache(filename: str, content: bytes):
-    os.makedirs(CACHE_DIR, exist_ok=True)
-    with open(filename, "wb") as f:
-        f.write(content)
-        f.close()
+# Kept with every entry so that expired entries can be revalidated instead of downloaded again
+VALIDATOR_HEADERS = ["etag", "last-modified", "cache-control"]
+
+
+def accepted_encodings(request: http.Request) -> set:
+    accepted = set()
+    for part in request.headers.get("Accept-Encoding", "").split(","):
+        name, _, params = part.strip().partition(";")
+        if name and params.replace(" ", "") not in ("q=0", "q=0.0"):
+            accepted.add(name.lower())
+    return accepted
+
+
+def make_cached_response(entry: CacheEntry, request: http.Request) -> http.Response:
+    headers = {"Content-Type": entry.headers.get("content-type", "application/json")}
+    if not entry.encoding:
+        body = entry.body
+    elif entry.encoding in accepted_encodings(request):
+        # Served exactly as stored, without decompressing
+        body = entry.body
+        headers["Content-Encoding"] = entry.encoding
+    else:
+        body = entry.decoded_body()
+    return http.Response.make(entry.status, body, headers)
+
+
+class TokenBucket:
+    # Paces upstream requests; misses queue on the lock, which wakes its waiters in arrival order
+    def __init__(self, rate_per_minute: int, burst: int):
+        self.rate = rate_per_minute / 60
+        self.burst = max(burst, 1)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+        self.queued = 0
+        self.max_queued = 0
+        self.granted = 0
+        self.total_wait = 0.0
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        started = time.monotonic()
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        try:
+            async with self.lock:
+                self.refill()
+                while self.tokens < 1:
+                    await asyncio.sleep((1 - self.tokens) / self.rate)
+                    self.refill()
+                self.tokens -= 1
+        finally:
+            self.queued -= 1
+        self.granted += 1
+        self.total_wait += time.monotonic() - started
+
+
+class CircuitBreaker:
+    # Opened by a 403, after which nothing goes upstream until the cool-down has passed
+    def __init__(self, cooldown: int):
+        self.cooldown = cooldown
+        self.opened_at = None
+        self.trips = 0
+        self.rejected = 0
+
+    def trip(self):
+        if self.opened_at is None:
+            print(f"[CIRCUIT OPEN] Rate limited by upstream, pausing upstream requests for {self.cooldown}s")
+        self.opened_at = time.monotonic()
+        self.trips += 1
+
+    def remaining(self) -> float:
+        if self.opened_at is None:
+            return 0
+        remaining = self.cooldown - (time.monotonic() - self.opened_at)
+        if remaining <= 0:
+            print("[CIRCUIT CLOSED] Cool-down over, resuming upstream requests")
+            self.opened_at = None
+            return 0
+        return remaining
+
+
+# Served by the proxy itself rather than forwarded upstream
+STATS_PATH = "/__cache/stats"
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+
+def endpoint_family(url: str) -> str:
+    # e.g. api/v1/event/{id}/pregame-form, so counters don't grow with every id
+    path = urlsplit(url).path.removeprefix("/api/v1/")
+    return re.sub(r"(?<=/)\d+(?=/|$)", "{id}", path)
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = {}
+        self.misses = {}
+        self.negative_hits = {}
+        self.coalesced = {}
+        self.bytes_served = {}
+        self.latency_buckets = {}
+        self.latency_sum = {}
+        self.latency_count = {}
+
+    def count(self, counter, family, amount=1):
+        counter[family] = counter.get(family, 0) + amount
+
+    def hit(self, url, entry: CacheEntry, size):
+        family = endpoint_family(url)
+        self.count(self.hits, family)
+        if entry.status in NEGATIVE_STATUSES:
+            self.count(self.negative_hits, family)
+        self.count(self.bytes_served, (family, "cache"), size)
+
+    def miss(self, url):
+        self.count(self.misses, endpoint_family(url))
+
+    def waited(self, url, response):
+        family = endpoint_family(url)
+        self.count(self.coalesced, family)
+        self.count(self.bytes_served, (family, "coalesced"), len(response.raw_content or b""))
+
+    def upstream(self, url, seconds, size):
+        family = endpoint_family(url)
+        self.count(self.bytes_served, (family, "upstream"), size)
+        buckets = self.latency_buckets.setdefault(family, [0] * len(LATENCY_BUCKETS))
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                buckets[i] += 1
+        self.count(self.latency_sum, family, seconds)
+        self.count(self.latency_count, family)
+
+    def render(self, upstream: dict) -> str:
+        # Prometheus text exposition format
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{label}"' for key, label in labels.items())
+                lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+
+        metric("cache_hits_total", "counter", "Requests answered from the cache",
+               [({"family": family}, value) for family, value in sorted(self.hits.items())])
+        metric("cache_negative_hits_total", "counter", "Requests answered from a cached 404/410",
+               [({"family": family}, value) for family, value in sorted(self.negative_hits.items())])
+        metric("cache_misses_total", "counter", "Requests that had to go upstream",
+               [({"family": family}, value) for family, value in sorted(self.misses.items())])
+        metric("cache_coalesced_total", "counter", "Requests answered by an identical in-flight request",
+               [({"family": family}, value) for family, value in sorted(self.coalesced.items())])
+        metric("cache_served_bytes_total", "counter", "Response body bytes sent to clients, by where they came from",
+               [({"family": family, "source": source}, value)
+                for (family, source), value in sorted(self.bytes_served.items())])
+
+        lines.append("# HELP cache_upstream_latency_seconds Time taken by upstream to answer a cache miss")
+        lines.append("# TYPE cache_upstream_latency_seconds histogram")
+        for family, buckets in sorted(self.latency_buckets.items()):
+            for bound, value in zip(LATENCY_BUCKETS, buckets):
+                lines.append(f'cache_upstream_latency_seconds_bucket{{family="{family}",le="{bound}"}} {value}')
+            count = self.latency_count[family]
+            lines.append(f'cache_upstream_latency_seconds_bucket{{family="{family}",le="+Inf"}} {count}')
+            lines.append(f'cache_upstream_latency_seconds_sum{{family="{family}"}} {self.latency_sum[family]}')
+            lines.append(f'cache_upstream_latency_seconds_count{{family="{family}"}} {count}')
+
+        metric("cache_upstream_requests_total", "counter", "Requests let through the rate limiter",
+               [({}, upstream["granted"])])
+        metric("cache_upstream_queued", "gauge", "Requests currently waiting for the rate limiter",
+               [({}, upstream["queued"])])
+        metric("cache_upstream_queue_wait_seconds_average", "gauge", "Average time spent waiting for the rate limiter",
+               [({}, upstream["average_wait"])])
+        metric("cache_upstream_breaker_open", "gauge", "1 while upstream is paused after a 403",
+               [({}, int(upstream["breaker_open"]))])
+        metric("cache_upstream_breaker_trips_total", "counter", "403 responses that opened the circuit breaker",
+               [({}, upstream["breaker_trips"])])
+        metric("cache_upstream_breaker_rejected_total", "counter", "Requests not sent upstream while paused",
+               [({}, upstream["breaker_rejected"])])
+        return "\n".join(lines) + "\n"
+
+
+# Cache reads are buffered and appended to the access log in batches, whichever of these comes first
+ACCESS_FLUSH_SIZE = 500
+ACCESS_FLUSH_SECONDS = 5 * MINUTE
+# With cache_max_mb set, the size budget is checked after this many stored responses
+EVICTION_CHECK_EVERY = 200
+
+
+class BackgroundWriter:
+    # Decompression and disk writes happen on this thread, so a slow disk never stalls other flows
+    def __init__(self):
+        self.jobs = queue.Queue()
+        self.written = 0
+        self.failed = 0
+        self.thread = threading.Thread(target=self.run, name="cache-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, job, done=None):
+        self.jobs.put((job, done))
+
+    def run(self):
+        while True:
+            item = self.jobs.get()
+            if item is None:
+                return
+            job, done = item
+            try:
+                job()
+                self.written += 1
+            except Exception as e:
+                self.failed += 1
+                print(f"[!] Cache write failed: {e}")
+            finally:
+                if done is not None:
+                    done()
+
+    def close(self):
+        # Finishes everything already queued before returning
+        self.jobs.put(None)
+        self.thread.join()
 
 
 class CacheResponses:
-    def request(self, flow: http.HTTPFlow):
-        url = flow.request.url
-        filename = url_to_filename(url)
+    def __init__(self):
+        self.store = None
+        self.memory = MemoryTier(0)
+        self.rate_limited = 0
+        # URL -> future of the response for the one request of it that has gone upstream
+        self.in_flight = {}
+        self.limiter = TokenBucket(0, 1)
+        self.breaker = CircuitBreaker(0)
+        self.stats = CacheStats()
+        self.writer = BackgroundWriter()
+        self.compression = ""
+        # URL -> (last read, reads) not yet written to the store's access log
+        self.accesses = {}
+        self.accesses_flushed = time.monotonic()
+        # Only touched from the writer thread
+        self.stored_since_eviction = 0
+
+    def load(self, loader):
+        loader.add_option(
+            name="cache_backend",
+            typespec=str,
+            default="file",
+            help="Where cached responses are stored: one file per URL, or a single SQLite database",
+            choices=list(STORE_BACKENDS),
+        )
+        loader.add_option(
+            name="cache_memory_mb",
+            typespec=int,
+            default=64,
+            help="Size of the in-memory tier in front of the cache backend, in megabytes of response bodies",
+        )
+        loader.add_option(
+            name="cache_negative_ttl",
+            typespec=int,
+            default=DAY,
+            help="Seconds a 404/410 response is served from the cache before it is asked for again",
+        )
+        loader.add_option(
+            name="upstream_rate",
+            typespec=int,
+            default=60,
+            help="Requests per minute let through to sofascore on cache misses (0 for no limit)",
+        )
+        loader.add_option(
+            name="upstream_burst",
+            typespec=int,
+            default=5,
+            help="Requests that may go upstream back to back before the rate limit applies",
+        )
+        loader.add_option(
+            name="upstream_cooldown",
+            typespec=int,
+            default=15 * MINUTE,
+            help="Seconds to stop sending requests upstream after sofascore answers with a 403",
+        )
+        loader.add_option(
+            name="cache_verbose",
+            typespec=bool,
+            default=True,
+            help=f"Print a line for every request; counters are always available at {STATS_PATH}",
+        )
+        loader.add_option(
+            name="cache_compression",
+            typespec=str,
+            default="gzip",
+            help="How response bodies are compressed at rest, and served to clients that accept it",
+            choices=list(COMPRESSIONS),
+        )
+        loader.add_option(
+            name="cache_max_mb",
+            typespec=int,
+            default=0,
+            help="Size the on-disk cache is kept under by evicting entries, in megabytes (0 for no limit)",
+        )
+        loader.add_option(
+            name="cache_eviction",
+            typespec=str,
+            default="lru",
+            help="Which entries go first when the cache is over cache_max_mb: least recently or least often read",
+            choices=list(EVICTION_POLICIES),
+        )
+        # One-shot move of a cache written before the sharded layout
+        moved, unmatched = migrate_flat_cache(CACHE_DIR)
+        if moved:
+            print(f"[CACHE] Migrated {moved} flat cache entries into the sharded layout")
+        if unmatched:
+            print(f"[!] {len(unmatched)} flat cache entries have no known URL and will be refetched")
+
+    def configure(self, updated):
+        if "cache_backend" in updated:
+            if self.store is not None:
+                self.store.close()
+            self.store = open_store(ctx.options.cache_backend, CACHE_DIR)
+        if "cache_memory_mb" in updated:
+            self.memory.resize(ctx.options.cache_memory_mb * 1024 * 1024)
+        if "upstream_rate" in updated or "upstream_burst" in updated:
+            self.limiter = TokenBucket(ctx.options.upstream_rate, ctx.options.upstream_burst)
+        if "cache_compression" in updated:
+            if ctx.options.cache_compression == "zstd" and zstandard is None:
+                raise exceptions.OptionsError("cache_compression=zstd needs the zstandard package")
+            self.compression = COMPRESSIONS[ctx.options.cache_compression]
+        if "upstream_cooldown" in updated:
+            self.breaker.cooldown = ctx.options.upstream_cooldown
+        if "cache_max_mb" in updated and ctx.options.cache_max_mb > 0:
+            self.writer.submit(self.enforce_cache_size)
+
+    def done(self):
+        self.flush_accesses()
+        self.writer.close()
+        if self.writer.failed:
+            print(f"[!] {self.writer.failed} cache writes failed")
+        print(f"[CACHE] Memory tier: {self.memory.hits} hits, {self.memory.misses} misses, "
+              f"{self.memory.used_bytes} bytes in {len(self.memory.entries)} entries")
+        coalesced = sum(self.stats.coalesced.values())
+        if coalesced:
+            print(f"[CACHE] {coalesced} requests waited on an identical request instead of going upstream")
+        if self.rate_limited:
+            print(f"[!] Upstream refused {self.rate_limited} requests with 403 (rate limited)")
+        stats = self.upstream_stats()
+        print(f"[CACHE] Upstream: {stats['granted']} requests sent, {stats['average_wait']:.2f}s average queue wait, "
+              f"{stats['max_queued']} most queued at once, circuit opened {stats['breaker_trips']} times, "
+              f"{stats['breaker_rejected']} requests cut off while open")
+        if self.store is not None:
+            self.store.close()
 
-        if os.path.exists(filename):
-            print(f"[CACHE HIT] Serving cached response for: {url}")
-            cached_content = load_from_cache(filename)
+    def log(self, message: str):
+        if ctx.options.cache_verbose:
+            print(message)
+
+    def upstream_stats(self) -> dict:
+        granted = self.limiter.granted
+        return {
+            "granted": granted,
+            "queued": self.limiter.queued,
+            "max_queued": self.limiter.max_queued,
+            "average_wait": self.limiter.total_wait / granted if granted else 0.0,
+            "breaker_open": self.breaker.remaining() > 0,
+            "breaker_trips": self.breaker.trips,
+            "breaker_rejected": self.breaker.rejected,
+        }
+
+    async def request(self, flow: http.HTTPFlow):
+        url = flow.request.url
+        if urlsplit(url).path == STATS_PATH:
+            flow.metadata["cache_hit"] = True
             flow.response = http.Response.make(
-                200,  # (optional) HTTP status code
-                cached_content,
-                {"Content-Type": "application/json"}  # adjust headers as needed
+                200,
+                self.stats.render(self.upstream_stats()).encode("utf-8"),
+                {"Content-Type": "text/plain; version=0.0.4"}
             )
+            return
+
+        entry = self.memory.get(url)
+        if entry is None:
+            entry = self.store.get(url)
+            if entry is not None:
+                self.memory.put(entry)
+
+        if entry is not None and not is_fresh(entry, ctx.options.cache_negative_ttl):
+            _, immutable_when_finished = freshness_rule(url)
+            if immutable_when_finished and all_events_finished(entry.decoded_body()):
+                # Cached before it was marked, but it can no longer change
+                entry.immutable = True
+                self.writer.submit(lambda: self.store.touch(entry))
+            else:
+                flow.metadata["stale"] = entry
+                self.revalidate(flow, entry)
+                entry = None
+
+        if entry is not None:
+            self.log(f"[CACHE HIT] Serving cached response for: {url}")
+            flow.metadata["cache_hit"] = True
+            flow.response = make_cached_response(entry, flow.request)
+            self.stats.hit(url, entry, len(flow.response.raw_content))
+            self.note_access(url)
+            return
+
+        self.stats.miss(url)
+        if self.breaker.remaining() > 0:
+            self.cut_off(flow)
+            return
+
+        await self.join_flight(flow)
+        if flow.response is not None:
+            return
+
+        await self.limiter.acquire()
+        # A 403 may have opened the circuit while this request was queued
+        if self.breaker.remaining() > 0:
+            self.cut_off(flow)
+            self.land_flight(flow, flow.response)
+            return
+        flow.metadata["upstream_started"] = time.monotonic()
+
+    def note_access(self, url: str):
+        note_access(self.accesses, url)
+        if len(self.accesses) >= ACCESS_FLUSH_SIZE or time.monotonic() - self.accesses_flushed > ACCESS_FLUSH_SECONDS:
+            self.flush_accesses()
+
+    def flush_accesses(self):
+        accesses, self.accesses = self.accesses, {}
+        self.accesses_flushed = time.monotonic()
+        if accesses:
+            self.writer.submit(lambda: self.store.record_access(accesses))
+
+    def enforce_cache_size(self):
+        # Runs on the background writer, between stores
+        self.stored_since_eviction = 0
+        evicted, remaining = evict_cache(self.store, ctx.options.cache_max_mb * 1024 * 1024,
+                                         ctx.options.cache_eviction)
+        for item in evicted:
+            self.memory.discard(item.url)
+        if evicted:
+            print(f"[CACHE] Evicted {len(evicted)} cached responses "
+                  f"({format_size(sum(item.size for item in evicted))}), {format_size(remaining)} left on disk")
+
+    def cut_off(self, flow: http.HTTPFlow):
+        # Serve cache-only while the circuit is open: an expired copy if there is one, otherwise fail fast
+        self.breaker.rejected += 1
+        flow.metadata["cache_hit"] = True
+        stale = flow.metadata.get("stale")
+        if stale is not None:
+            self.log(f"[CIRCUIT OPEN] Serving expired cached response for: {flow.request.url}")
+            flow.response = make_cached_response(stale, flow.request)
+            return
+        self.log(f"[CIRCUIT OPEN] Not sending {flow.request.url} upstream")
+        flow.response = http.Response.make(
+            503,
+            b'{"error": "upstream paused after being rate limited"}',
+            {"Content-Type": "application/json", "Retry-After": str(int(self.breaker.remaining()) + 1),
+             CIRCUIT_OPEN_HEADER: "1"}
+        )
+
+    async def join_flight(self, flow: http.HTTPFlow):
+        # Only the first request for a URL goes upstream, identical ones wait for its response
+        key = normalise_url(flow.request.url)
+        while True:
+            pending = self.in_flight.get(key)
+            if pending is None:
+                self.in_flight[key] = asyncio.get_running_loop().create_future()
+                flow.metadata["flight_leader"] = key
+                return
+            self.log(f"[COALESCED] Waiting on in-flight request for: {flow.request.url}")
+            response = await asyncio.shield(pending)
+            if response is not None:
+                flow.metadata["cache_hit"] = True
+                flow.response = response.copy()
+                self.stats.waited(flow.request.url, flow.response)
+                return
+            # The request we waited on failed: the first waiter to wake takes its place and goes upstream,
+            # and the rest wait on that one instead
+
+    def land_flight(self, flow: http.HTTPFlow, response):
+        key = flow.metadata.pop("flight_leader", None)
+        if key is None:
+            return
+        pending = self.in_flight.pop(key)
+        if not pending.done():
+            pending.set_result(response)
+
+    def revalidate(self, flow: http.HTTPFlow, entry: CacheEntry):
+        # Ask upstream whether our copy is still current, so an unchanged resource costs a 304, not a body
+        etag = entry.headers.get("etag")
+        last_modified = entry.headers.get("last-modified")
+        if etag is None and last_modified is None:
+            self.log(f"[STALE] Refetching expired response for: {flow.request.url}")
+            return
+        self.log(f"[STALE] Revalidating expired response for: {flow.request.url}")
+        if etag is not None:
+            flow.request.headers["If-None-Match"] = etag
+        if last_modified is not None:
+            flow.request.headers["If-Modified-Since"] = last_modified
 
     def response(self, flow: http.HTTPFlow):
+        # The response hook also runs for responses we made ourselves, which are already stored
+        if flow.metadata.get("cache_hit"):
+            return
+        job = None
+        try:
+            job = self.store_response(flow)
+        finally:
+            if job is None:
+                self.land_flight(flow, flow.response)
+            else:
+                # The client already has its response; identical requests wait until the entry is stored
+                # so that none of them slips through to upstream in the meantime
+                loop = asyncio.get_running_loop()
+                response = flow.response
+                self.writer.submit(job, lambda: loop.call_soon_threadsafe(self.land_flight, flow, response))
+
+    def error(self, flow: http.HTTPFlow):
+        self.land_flight(flow, None)
+
+    def store_response(self, flow: http.HTTPFlow):
+        # Decides what to do with an upstream response; anything that touches the disk is returned as a
+        # job for the background writer
         url = flow.request.url
-        filename = url_to_filename(url)
+        if "upstream_started" in flow.metadata:
+            self.stats.upstream(url, time.monotonic() - flow.metadata["upstream_started"],
+                                len(flow.response.raw_content or b""))
 
-        # Only cache successful (status 200) responses
-        if flow.response.status_code != 200:
-            print(f"[SKIP CACHE] Not caching response for {url} (status: {flow.response.status_code})")
-            return
+        entry = flow.metadata.get("stale")
+        if entry is not None and flow.response.status_code == 304:
+            self.log(f"[NOT MODIFIED] Cached response for {url} is still current")
+            entry.fetched_at = time.time()
+            # A 304 carries the current validators, which replace the stored ones
+            for name in VALIDATOR_HEADERS:
+                if name in flow.response.headers:
+                    entry.headers[name] = flow.response.headers[name]
+            flow.response = make_cached_response(entry, flow.request)
+            return lambda: self.store.touch(entry)
+
+        # A 403 means sofascore is rate limiting us, not that the resource is missing
+        if flow.response.status_code == 403:
+            self.rate_limited += 1
+            self.breaker.trip()
+            if entry is not None:
+                self.log(f"[RATE LIMITED] Serving expired cached response for {url}")
+                flow.response = make_cached_response(entry, flow.request)
+            else:
+                self.log(f"[RATE LIMITED] Upstream refused {url} (status: 403)")
+            return None
 
+        # Only cache successful (status 200) and known-missing responses
+        if flow.response.status_code != 200 and flow.response.status_code not in NEGATIVE_STATUSES:
+            self.log(f"[SKIP CACHE] Not caching response for {url} (status: {flow.response.status_code})")
+            return None
+
+        status = flow.response.status_code
         content = flow.response.raw_content
         encoding = flow.response.headers.get("Content-Encoding", "")
+        headers = headers_to_store(flow.response.headers)
+        return lambda: self.persist(url, status, content, encoding, headers)
 
-        if "gzip" in encoding.lower():
+    def persist(self, url, status, content, encoding, headers):
+        # Runs on the background writer
+        encoding = encoding.strip().lower()
+        if encoding == "identity":
+            encoding = ""
+        target = self.compression if status == 200 else ""
+        decoded = None
+        if encoding != target:
             try:
-                with gzip.GzipFile(fileobj=BytesIO(content)) as gz:
-                    content = gz.read()
-                # Update headers for decompressed content
-                flow.response.headers["Content-Encoding"] = ""
-                flow.response.headers["Content-Length"] = str(len(content))
-                flow.response.content = content
-            except Exception as e:
-                print(f"[!] Gzip decompression failed for {url}: {e}")
-                # fallback: leave content as is
+                decoded = http_encoding.decode(content, encoding) if encoding else content
+            except ValueError as e:
+                print(f"[!] Could not decode {encoding} response for {url}, storing it as received: {e}")
+                target = encoding
+        if target == encoding:
+            # Already in the format we keep, e.g. upstream gzip stored as gzip - no decompress and recompress
+            stored = content
+        else:
+            stored = compress(decoded, target)
 
-        save_to_cache(filename, content)
+        if status != 200:
+            self.log(f"[NEGATIVE CACHE] Caching missing resource {url} (status: {status})")
+            stored = stored[:NEGATIVE_BODY_LIMIT]
 
+        entry = CacheEntry(url, stored, status, headers, encoding=target)
+        ttl, immutable_when_finished = freshness_rule(url)
+        if entry.status == 200:
+            # Kept forever by its rule, or finished - either way it will never be fetched again
+            entry.immutable = ttl is None or (immutable_when_finished and all_events_finished(entry.decoded_body()))
+        self.store.put(entry)
+        self.memory.put(entry)
+        self.stored_since_eviction += 1
+        if ctx.options.cache_max_mb > 0 and self.stored_since_eviction >= EVICTION_CHECK_EVERY:
+            self.enforce_cache_size()
 
 addons = [CacheResponses()]
 
@@ -0,0 +1,193 @@
+# The premier league on the 26th of April 2025: the matches played, as [home, [home goals, away goals], away],
+# and the matches left to play, as [home, away]
+EXAMPLE_MATCHES = [['Manchester United', [1, 0], 'Fulham'], ['Ipswich Town', [0, 2], 'Liverpool'],
+                   ['Arsenal', [2, 0], 'Wolverhampton'], ['Everton', [0, 3], 'Brighton & Hove Albion'],
+                   ['Newcastle United', [1, 0], 'Southampton'], ['Nottingham Forest', [1, 1], 'Bournemouth'],
+                   ['West Ham United', [1, 2], 'Aston Villa'], ['Brentford', [2, 1], 'Crystal Palace'],
+                   ['Chelsea', [0, 2], 'Manchester City'], ['Leicester City', [1, 1], 'Tottenham Hotspur'],
+                   ['Brighton & Hove Albion', [2, 1], 'Manchester United'], ['Crystal Palace', [0, 2], 'West Ham United'],
+                   ['Fulham', [2, 1], 'Leicester City'], ['Manchester City', [4, 1], 'Ipswich Town'],
+                   ['Southampton', [0, 1], 'Nottingham Forest'], ['Tottenham Hotspur', [4, 0], 'Everton'],
+                   ['Aston Villa', [0, 2], 'Arsenal'], ['Bournemouth', [1, 1], 'Newcastle United'],
+                   ['Wolverhampton', [2, 6], 'Chelsea'], ['Liverpool', [2, 0], 'Brentford'],
+                   ['Arsenal', [1, 1], 'Brighton & Hove Albion'], ['Brentford', [3, 1], 'Southampton'],
+                   ['Everton', [2, 3], 'Bournemouth'], ['Ipswich Town', [1, 1], 'Fulham'],
+                   ['Leicester City', [1, 2], 'Aston Villa'], ['Nottingham Forest', [1, 1], 'Wolverhampton'],
+                   ['West Ham United', [1, 3], 'Manchester City'], ['Chelsea', [1, 1], 'Crystal Palace'],
+                   ['Newcastle United', [2, 1], 'Tottenham Hotspur'], ['Manchester United', [0, 3], 'Liverpool'],
+                   ['Southampton', [0, 3], 'Manchester United'], ['Brighton & Hove Albion', [0, 0], 'Ipswich Town'],
+                   ['Crystal Palace', [2, 2], 'Leicester City'], ['Fulham', [1, 1], 'West Ham United'],
+                   ['Liverpool', [0, 1], 'Nottingham Forest'], ['Manchester City', [2, 1], 'Brentford'],
+                   ['Aston Villa', [3, 2], 'Everton'], ['Bournemouth', [0, 1], 'Chelsea'],
+                   ['Tottenham Hotspur', [0, 1], 'Arsenal'], ['Wolverhampton', [1, 2], 'Newcastle United'],
+                   ['West Ham United', [0, 3], 'Chelsea'], ['Aston Villa', [3, 1], 'Wolverhampton'],
+                   ['Fulham', [3, 1], 'Newcastle United'], ['Leicester City', [1, 1], 'Everton'],
+                   ['Liverpool', [3, 0], 'Bournemouth'], ['Southampton', [1, 1], 'Ipswich Town'],
+                   ['Tottenham Hotspur', [3, 1], 'Brentford'], ['Crystal Palace', [0, 0], 'Manchester United'],
+                   ['Brighton & Hove Albion', [2, 2], 'Nottingham Forest'], ['Manchester City', [2, 2], 'Arsenal'],
+                   ['Newcastle United', [1, 1], 'Manchester City'], ['Arsenal', [4, 2], 'Leicester City'],
+                   ['Brentford', [1, 1], 'West Ham United'], ['Chelsea', [4, 2], 'Brighton & Hove Albion'],
+                   ['Everton', [2, 1], 'Crystal Palace'], ['Nottingham Forest', [0, 1], 'Fulham'],
+                   ['Wolverhampton', [1, 2], 'Liverpool'], ['Ipswich Town', [2, 2], 'Aston Villa'],
+                   ['Manchester United', [0, 3], 'Tottenham Hotspur'], ['Bournemouth', [3, 1], 'Southampton'],
+                   ['Crystal Palace', [0, 1], 'Liverpool'], ['Arsenal', [3, 1], 'Southampton'],
+                   ['Brentford', [5, 3], 'Wolverhampton'], ['Leicester City', [1, 0], 'Bournemouth'],
+                   ['Manchester City', [3, 2], 'Fulham'], ['West Ham United', [4, 1], 'Ipswich Town'],
+                   ['Everton', [0, 0], 'Newcastle United'], ['Aston Villa', [0, 0], 'Manchester United'],
+                   ['Chelsea', [1, 1], 'Nottingham Forest'], ['Brighton & Hove Albion', [3, 2], 'Tottenham Hotspur'],
+                   ['Tottenham Hotspur', [4, 1], 'West Ham United'], ['Fulham', [1, 3], 'Aston Villa'],
+                   ['Manchester United', [2, 1], 'Brentford'], ['Newcastle United', [0, 1], 'Brighton & Hove Albion'],
+                   ['Southampton', [2, 3], 'Leicester City'], ['Ipswich Town', [0, 2], 'Everton'],
+                   ['Bournemouth', [2, 0], 'Arsenal'], ['Wolverhampton', [1, 2], 'Manchester City'],
+                   ['Liverpool', [2, 1], 'Chelsea'], ['Nottingham Forest', [1, 0], 'Crystal Palace'],
+                   ['Leicester City', [1, 3], 'Nottingham Forest'], ['Aston Villa', [1, 1], 'Bournemouth'],
+                   ['Brentford', [4, 3], 'Ipswich Town'], ['Brighton & Hove Albion', [2, 2], 'Wolverhampton'],
+                   ['Manchester City', [1, 0], 'Southampton'], ['Everton', [1, 1], 'Fulham'],
+                   ['Chelsea', [2, 1], 'Newcastle United'], ['Crystal Palace', [1, 0], 'Tottenham Hotspur'],
+                   ['West Ham United', [2, 1], 'Manchester United'], ['Arsenal', [2, 2], 'Liverpool'],
+                   ['Newcastle United', [1, 0], 'Arsenal'], ['Bournemouth', [2, 1], 'Manchester City'],
+                   ['Ipswich Town', [1, 1], 'Leicester City'], ['Liverpool', [2, 1], 'Brighton & Hove Albion'],
+                   ['Nottingham Forest', [3, 0], 'West Ham United'], ['Southampton', [1, 0], 'Everton'],
+                   ['Wolverhampton', [2, 2], 'Crystal Palace'], ['Tottenham Hotspur', [4, 1], 'Aston Villa'],
+                   ['Manchester United', [1, 1], 'Chelsea'], ['Fulham', [2, 1], 'Brentford'],
+                   ['Brentford', [3, 2], 'Bournemouth'], ['Crystal Palace', [0, 2], 'Fulham'],
+                   ['West Ham United', [0, 0], 'Everton'], ['Wolverhampton', [2, 0], 'Southampton'],
+                   ['Brighton & Hove Albion', [2, 1], 'Manchester City'], ['Liverpool', [2, 0], 'Aston Villa'],
+                   ['Manchester United', [3, 0], 'Leicester City'], ['Nottingham Forest', [1, 3], 'Newcastle United'],
+                   ['Tottenham Hotspur', [1, 2], 'Ipswich Town'], ['Chelsea', [1, 1], 'Arsenal'],
+                   ['Leicester City', [1, 2], 'Chelsea'], ['Arsenal', [3, 0], 'Nottingham Forest'],
+                   ['Aston Villa', [2, 2], 'Crystal Palace'], ['Bournemouth', [1, 2], 'Brighton & Hove Albion'],
+                   ['Everton', [0, 0], 'Brentford'], ['Fulham', [1, 4], 'Wolverhampton'],
+                   ['Manchester City', [0, 4], 'Tottenham Hotspur'], ['Southampton', [2, 3], 'Liverpool'],
+                   ['Ipswich Town', [1, 1], 'Manchester United'], ['Newcastle United', [0, 2], 'West Ham United'],
+                   ['Brighton & Hove Albion', [1, 1], 'Southampton'], ['Brentford', [4, 1], 'Leicester City'],
+                   ['Crystal Palace', [1, 1], 'Newcastle United'], ['Nottingham Forest', [1, 0], 'Ipswich Town'],
+                   ['Wolverhampton', [2, 4], 'Bournemouth'], ['West Ham United', [2, 5], 'Arsenal'],
+                   ['Chelsea', [3, 0], 'Aston Villa'], ['Manchester United', [4, 0], 'Everton'],
+                   ['Tottenham Hotspur', [1, 1], 'Fulham'], ['Liverpool', [2, 0], 'Manchester City'],
+                   ['Ipswich Town', [0, 1], 'Crystal Palace'], ['Leicester City', [3, 1], 'West Ham United'],
+                   ['Everton', [4, 0], 'Wolverhampton'], ['Manchester City', [3, 0], 'Nottingham Forest'],
+                   ['Newcastle United', [3, 3], 'Liverpool'], ['Southampton', [1, 5], 'Chelsea'],
+                   ['Arsenal', [2, 0], 'Manchester United'], ['Aston Villa', [3, 1], 'Brentford'],
+                   ['Fulham', [3, 1], 'Brighton & Hove Albion'], ['Bournemouth', [1, 0], 'Tottenham Hotspur'],
+                   ['Aston Villa', [1, 0], 'Southampton'], ['Brentford', [4, 2], 'Newcastle United'],
+                   ['Crystal Palace', [2, 2], 'Manchester City'], ['Manchester United', [2, 3], 'Nottingham Forest'],
+                   ['Fulham', [1, 1], 'Arsenal'], ['Ipswich Town', [1, 2], 'Bournemouth'],
+                   ['Leicester City', [2, 2], 'Brighton & Hove Albion'], ['Tottenham Hotspur', [3, 4], 'Chelsea'],
+                   ['West Ham United', [2, 1], 'Wolverhampton'], ['Everton', [2, 2], 'Liverpool'],
+                   ['Arsenal', [0, 0], 'Everton'], ['Liverpool', [2, 2], 'Fulham'],
+                   ['Newcastle United', [4, 0], 'Leicester City'], ['Wolverhampton', [1, 2], 'Ipswich Town'],
+                   ['Nottingham Forest', [2, 1], 'Aston Villa'], ['Brighton & Hove Albion', [1, 3], 'Crystal Palace'],
+                   ['Manchester City', [1, 2], 'Manchester United'], ['Chelsea', [2, 1], 'Brentford'],
+                   ['Southampton', [0, 5], 'Tottenham Hotspur'], ['Bournemouth', [1, 1], 'West Ham United'],
+                   ['Aston Villa', [2, 1], 'Manchester City'], ['Brentford', [0, 2], 'Nottingham Forest'],
+                   ['Ipswich Town', [0, 4], 'Newcastle United'], ['West Ham United', [1, 1], 'Brighton & Hove Albion'],
+                   ['Crystal Palace', [1, 5], 'Arsenal'], ['Everton', [0, 0], 'Chelsea'], ['Fulham', [0, 0], 'Southampton'],
+                   ['Leicester City', [0, 3], 'Wolverhampton'], ['Manchester United', [0, 3], 'Bournemouth'],
+                   ['Tottenham Hotspur', [3, 6], 'Liverpool'], ['Manchester City', [1, 1], 'Everton'],
+                   ['Bournemouth', [0, 0], 'Crystal Palace'], ['Chelsea', [1, 2], 'Fulham'],
+                   ['Newcastle United', [3, 0], 'Aston Villa'], ['Nottingham Forest', [1, 0], 'Tottenham Hotspur'],
+                   ['Southampton', [0, 1], 'West Ham United'], ['Wolverhampton', [2, 0], 'Manchester United'],
+                   ['Liverpool', [3, 1], 'Leicester City'], ['Brighton & Hove Albion', [0, 0], 'Brentford'],
+                   ['Arsenal', [1, 0], 'Ipswich Town'], ['Leicester City', [0, 2], 'Manchester City'],
+                   ['Crystal Palace', [2, 1], 'Southampton'], ['Everton', [0, 2], 'Nottingham Forest'],
+                   ['Fulham', [2, 2], 'Bournemouth'], ['Tottenham Hotspur', [2, 2], 'Wolverhampton'],
+                   ['West Ham United', [0, 5], 'Liverpool'], ['Aston Villa', [2, 2], 'Brighton & Hove Albion'],
+                   ['Ipswich Town', [2, 0], 'Chelsea'], ['Manchester United', [0, 2], 'Newcastle United'],
+                   ['Brentford', [1, 3], 'Arsenal'], ['Tottenham Hotspur', [1, 2], 'Newcastle United'],
+                   ['Aston Villa', [2, 1], 'Leicester City'], ['Bournemouth', [1, 0], 'Everton'],
+                   ['Crystal Palace', [1, 1], 'Chelsea'], ['Manchester City', [4, 1], 'West Ham United'],
+                   ['Southampton', [0, 5], 'Brentford'], ['Brighton & Hove Albion', [1, 1], 'Arsenal'],
+                   ['Fulham', [2, 2], 'Ipswich Town'], ['Liverpool', [2, 2], 'Manchester United'],
+                   ['Wolverhampton', [0, 3], 'Nottingham Forest'], ['Brentford', [2, 2], 'Manchester City'],
+                   ['Chelsea', [2, 2], 'Bournemouth'], ['West Ham United', [3, 2], 'Fulham'],
+                   ['Nottingham Forest', [1, 1], 'Liverpool'], ['Everton', [0, 1], 'Aston Villa'],
+                   ['Leicester City', [0, 2], 'Crystal Palace'], ['Newcastle United', [3, 0], 'Wolverhampton'],
+                   ['Arsenal', [2, 1], 'Tottenham Hotspur'], ['Ipswich Town', [0, 2], 'Brighton & Hove Albion'],
+                   ['Manchester United', [3, 1], 'Southampton'], ['Newcastle United', [1, 4], 'Bournemouth'],
+                   ['Brentford', [0, 2], 'Liverpool'], ['Leicester City', [0, 2], 'Fulham'],
+                   ['West Ham United', [0, 2], 'Crystal Palace'], ['Arsenal', [2, 2], 'Aston Villa'],
+                   ['Everton', [3, 2], 'Tottenham Hotspur'], ['Manchester United', [1, 3], 'Brighton & Hove Albion'],
+                   ['Nottingham Forest', [3, 2], 'Southampton'], ['Ipswich Town', [0, 6], 'Manchester City'],
+                   ['Chelsea', [3, 1], 'Wolverhampton'], ['Bournemouth', [5, 0], 'Nottingham Forest'],
+                   ['Brighton & Hove Albion', [0, 1], 'Everton'], ['Liverpool', [4, 1], 'Ipswich Town'],
+                   ['Southampton', [1, 3], 'Newcastle United'], ['Wolverhampton', [0, 1], 'Arsenal'],
+                   ['Manchester City', [3, 1], 'Chelsea'], ['Crystal Palace', [1, 2], 'Brentford'],
+                   ['Tottenham Hotspur', [1, 2], 'Leicester City'], ['Aston Villa', [1, 1], 'West Ham United'],
+                   ['Fulham', [0, 1], 'Manchester United'], ['Nottingham Forest', [7, 0], 'Brighton & Hove Albion'],
+                   ['Bournemouth', [0, 2], 'Liverpool'], ['Everton', [4, 0], 'Leicester City'],
+                   ['Ipswich Town', [1, 2], 'Southampton'], ['Newcastle United', [1, 2], 'Fulham'],
+                   ['Wolverhampton', [2, 0], 'Aston Villa'], ['Brentford', [0, 2], 'Tottenham Hotspur'],
+                   ['Manchester United', [0, 2], 'Crystal Palace'], ['Arsenal', [5, 1], 'Manchester City'],
+                   ['Chelsea', [2, 1], 'West Ham United'], ['Brighton & Hove Albion', [3, 0], 'Chelsea'],
+                   ['Leicester City', [0, 2], 'Arsenal'], ['Aston Villa', [1, 1], 'Ipswich Town'],
+                   ['Fulham', [2, 1], 'Nottingham Forest'], ['Manchester City', [4, 0], 'Newcastle United'],
+                   ['Southampton', [1, 3], 'Bournemouth'], ['West Ham United', [0, 1], 'Brentford'],
+                   ['Crystal Palace', [1, 2], 'Everton'], ['Liverpool', [2, 1], 'Wolverhampton'],
+                   ['Tottenham Hotspur', [1, 0], 'Manchester United'], ['Leicester City', [0, 4], 'Brentford'],
+                   ['Everton', [2, 2], 'Manchester United'], ['Arsenal', [0, 1], 'West Ham United'],
+                   ['Bournemouth', [0, 1], 'Wolverhampton'], ['Fulham', [0, 2], 'Crystal Palace'],
+                   ['Ipswich Town', [1, 4], 'Tottenham Hotspur'], ['Southampton', [0, 4], 'Brighton & Hove Albion'],
+                   ['Aston Villa', [2, 1], 'Chelsea'], ['Newcastle United', [4, 3], 'Nottingham Forest'],
+                   ['Manchester City', [0, 2], 'Liverpool'], ['Brighton & Hove Albion', [2, 1], 'Bournemouth'],
+                   ['Crystal Palace', [4, 1], 'Aston Villa'], ['Wolverhampton', [1, 2], 'Fulham'],
+                   ['Chelsea', [4, 0], 'Southampton'], ['Brentford', [1, 1], 'Everton'],
+                   ['Manchester United', [3, 2], 'Ipswich Town'], ['Nottingham Forest', [0, 0], 'Arsenal'],
+                   ['Tottenham Hotspur', [0, 1], 'Manchester City'], ['Liverpool', [2, 0], 'Newcastle United'],
+                   ['West Ham United', [2, 0], 'Leicester City'], ['Nottingham Forest', [1, 0], 'Manchester City'],
+                   ['Brighton & Hove Albion', [2, 1], 'Fulham'], ['Crystal Palace', [1, 0], 'Ipswich Town'],
+                   ['Liverpool', [3, 1], 'Southampton'], ['Brentford', [0, 1], 'Aston Villa'],
+                   ['Wolverhampton', [1, 1], 'Everton'], ['Chelsea', [1, 0], 'Leicester City'],
+                   ['Tottenham Hotspur', [2, 2], 'Bournemouth'], ['Manchester United', [1, 1], 'Arsenal'],
+                   ['West Ham United', [0, 1], 'Newcastle United'], ['Aston Villa', [2, 2], 'Liverpool'],
+                   ['Everton', [1, 1], 'West Ham United'], ['Ipswich Town', [2, 4], 'Nottingham Forest'],
+                   ['Manchester City', [2, 2], 'Brighton & Hove Albion'], ['Southampton', [1, 2], 'Wolverhampton'],
+                   ['Bournemouth', [1, 2], 'Brentford'], ['Arsenal', [1, 0], 'Chelsea'],
+                   ['Fulham', [2, 0], 'Tottenham Hotspur'], ['Leicester City', [0, 3], 'Manchester United'],
+                   ['Newcastle United', [5, 0], 'Crystal Palace'], ['Arsenal', [2, 1], 'Fulham'],
+                   ['Wolverhampton', [1, 0], 'West Ham United'], ['Nottingham Forest', [1, 0], 'Manchester United'],
+                   ['Bournemouth', [1, 2], 'Ipswich Town'], ['Brighton & Hove Albion', [0, 3], 'Aston Villa'],
+                   ['Manchester City', [2, 0], 'Leicester City'], ['Newcastle United', [2, 1], 'Brentford'],
+                   ['Southampton', [1, 1], 'Crystal Palace'], ['Liverpool', [1, 0], 'Everton'],
+                   ['Chelsea', [1, 0], 'Tottenham Hotspur'], ['Everton', [1, 1], 'Arsenal'],
+                   ['Crystal Palace', [2, 1], 'Brighton & Hove Albion'], ['Ipswich Town', [1, 2], 'Wolverhampton'],
+                   ['West Ham United', [2, 2], 'Bournemouth'], ['Aston Villa', [2, 1], 'Nottingham Forest'],
+                   ['Brentford', [0, 0], 'Chelsea'], ['Fulham', [3, 2], 'Liverpool'],
+                   ['Tottenham Hotspur', [3, 1], 'Southampton'], ['Manchester United', [0, 0], 'Manchester City'],
+                   ['Leicester City', [0, 3], 'Newcastle United'], ['Manchester City', [5, 2], 'Crystal Palace'],
+                   ['Brighton & Hove Albion', [2, 2], 'Leicester City'], ['Nottingham Forest', [0, 1], 'Everton'],
+                   ['Southampton', [0, 3], 'Aston Villa'], ['Arsenal', [1, 1], 'Brentford'],
+                   ['Chelsea', [2, 2], 'Ipswich Town'], ['Liverpool', [2, 1], 'West Ham United'],
+                   ['Wolverhampton', [4, 2], 'Tottenham Hotspur'], ['Newcastle United', [4, 1], 'Manchester United'],
+                   ['Bournemouth', [1, 0], 'Fulham'], ['Brentford', [4, 2], 'Brighton & Hove Albion'],
+                   ['Crystal Palace', [0, 0], 'Bournemouth'], ['Everton', [0, 2], 'Manchester City'],
+                   ['West Ham United', [1, 1], 'Southampton'], ['Aston Villa', [4, 1], 'Newcastle United'],
+                   ['Fulham', [1, 2], 'Chelsea'], ['Ipswich Town', [0, 4], 'Arsenal'],
+                   ['Manchester United', [0, 1], 'Wolverhampton'], ['Leicester City', [0, 1], 'Liverpool'],
+                   ['Tottenham Hotspur', [1, 2], 'Nottingham Forest'], ['Manchester City', [2, 1], 'Aston Villa'],
+                   ['Arsenal', [2, 2], 'Crystal Palace'], ['Chelsea', [1, 0], 'Everton'],
+                   ['Brighton & Hove Albion', [3, 2], 'West Ham United'], ['Newcastle United', [3, 0], 'Ipswich Town'],
+                   ['Southampton', [1, 2], 'Fulham'], ['Wolverhampton', [3, 0], 'Leicester City']]
+
+EXAMPLE_REMAINING = [['Bournemouth', 'Manchester United'], ['Liverpool', 'Tottenham Hotspur'],
+                     ['Nottingham Forest', 'Brentford'], ['Manchester City', 'Wolverhampton'],
+                     ['Aston Villa', 'Fulham'],
+                     ['Everton', 'Ipswich Town'], ['Leicester City', 'Southampton'], ['Arsenal', 'Bournemouth'],
+                     ['Brentford', 'Manchester United'], ['Brighton & Hove Albion', 'Newcastle United'],
+                     ['West Ham United', 'Tottenham Hotspur'], ['Chelsea', 'Liverpool'],
+                     ['Crystal Palace', 'Nottingham Forest'], ['Fulham', 'Everton'], ['Ipswich Town', 'Brentford'],
+                     ['Southampton', 'Manchester City'], ['Wolverhampton', 'Brighton & Hove Albion'],
+                     ['Bournemouth', 'Aston Villa'], ['Newcastle United', 'Chelsea'],
+                     ['Manchester United', 'West Ham United'], ['Nottingham Forest', 'Leicester City'],
+                     ['Tottenham Hotspur', 'Crystal Palace'], ['Liverpool', 'Arsenal'],
+                     ['Chelsea', 'Manchester United'],
+                     ['Everton', 'Southampton'], ['Aston Villa', 'Tottenham Hotspur'],
+                     ['West Ham United', 'Nottingham Forest'], ['Brentford', 'Fulham'],
+                     ['Crystal Palace', 'Wolverhampton'], ['Leicester City', 'Ipswich Town'],
+                     ['Arsenal', 'Newcastle United'], ['Manchester City', 'Bournemouth'],
+                     ['Brighton & Hove Albion', 'Liverpool'], ['Bournemouth', 'Leicester City'],
+                     ['Fulham', 'Manchester City'], ['Ipswich Town', 'West Ham United'],
+                     ['Liverpool', 'Crystal Palace'],
+                     ['Manchester United', 'Aston Villa'], ['Newcastle United', 'Everton'],
+                     ['Nottingham Forest', 'Chelsea'], ['Southampton', 'Arsenal'],
+                     ['Tottenham Hotspur', 'Brighton & Hove Albion'], ['Wolverhampton', 'Brentford']]
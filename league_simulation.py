@@ -0,0 +1,106 @@
+import numpy as np
+
+from league_table import LeagueTable
+
+# Home win, draw, away win - for every remaining match unless given per match
+MATCH_PROBABILITIES = (0.45, 0.25, 0.30)
+# Bytes a batch of simulated seasons may take, however many seasons are asked for
+MEMORY_BUDGET = 64 * 1024 * 1024
+# Normal quantile for 95% confidence intervals
+Z_95 = 1.959964
+
+
+def _outcome_thresholds(probabilities, matches):
+    # Cumulative (home win, home win + draw) per match, from one triple for every match or one per match
+    probabilities = np.asarray(probabilities, dtype=np.float64)
+    if probabilities.shape == (3,):
+        probabilities = np.broadcast_to(probabilities, (matches, 3))
+    if probabilities.shape != (matches, 3):
+        raise ValueError(f"Expected 3 outcome probabilities, or 3 for each of the {matches} remaining matches")
+    if (probabilities < 0).any() or not np.allclose(probabilities.sum(axis=1), 1):
+        raise ValueError("Outcome probabilities must be non-negative and add up to 1 for every match")
+    return np.cumsum(probabilities[:, :2], axis=1)
+
+
+def batch_size(teams, matches, memory_budget=MEMORY_BUDGET):
+    # Seasons per batch: a season's random draws and outcomes for each match, and its points, sort keys
+    # and finishing order for each team
+    per_season = matches * (8 + 1 + 4 + 4) + teams * (4 + 8 + 8 + 8)
+    return max(1, memory_budget // per_season)
+
+
+def simulate_finishes(matches, remaining, samples=1_000_000, probabilities=MATCH_PROBABILITIES,
+                      memory_budget=MEMORY_BUDGET, seed=None):
+    # Plays out the remaining matches `samples` times, a batch at a time, and counts where each team
+    # finishes. Returns the table and a (team, position) array of counts, teams by their table index.
+    # Teams level on points are separated by the goal difference and goals scored they have now, and
+    # at random if those are level too
+    table = LeagueTable(matches)
+    fixtures = np.array(table.fixtures(remaining), dtype=np.intp).reshape(-1, 2)
+    teams = len(table.teams)
+    thresholds = _outcome_thresholds(probabilities, len(fixtures))
+    rng = np.random.default_rng(seed)
+
+    # Which team is at home (and away) in each match, so a batch's points are two matrix products
+    home = np.zeros((len(fixtures), teams), dtype=np.float32)
+    away = np.zeros((len(fixtures), teams), dtype=np.float32)
+    home[np.arange(len(fixtures)), fixtures[:, 0]] = 1
+    away[np.arange(len(fixtures)), fixtures[:, 1]] = 1
+    home_points = np.array([3, 1, 0], dtype=np.float32)
+    away_points = np.array([0, 1, 3], dtype=np.float32)
+    base_points = np.array(table.points, dtype=np.float32)
+    # 0 for the worst goal difference and goals scored up to teams - 1 for the best, level teams sharing
+    tiebreak = np.unique(np.array([table.goal_difference, table.goals_scored]).T, axis=0, return_inverse=True)[1]
+    tiebreak = tiebreak.reshape(-1).astype(np.float64)
+
+    counts = np.zeros((teams, teams), dtype=np.int64)
+    size = batch_size(teams, len(fixtures), memory_budget)
+    done = 0
+    while done < samples:
+        batch = min(size, samples - done)
+        draws = rng.random((batch, len(fixtures)))
+        # 0 home win, 1 draw, 2 away win
+        outcomes = (draws >= thresholds[:, 0]).astype(np.int8) + (draws >= thresholds[:, 1])
+        del draws
+        points = base_points + home_points[outcomes] @ home + away_points[outcomes] @ away
+        del outcomes
+        # Points first, then the tiebreak, then a random fraction for teams level on both
+        key = points.astype(np.float64) * (teams + 1) + tiebreak + rng.random((batch, teams))
+        finishing_order = np.argsort(-key, axis=1)
+        for position in range(teams):
+            counts[:, position] += np.bincount(finishing_order[:, position], minlength=teams)
+        done += batch
+    return table, counts
+
+
+def confidence_intervals(counts, z=Z_95):
+    # Wilson score intervals for each count as a share of its row's total
+    samples = counts.sum(axis=1, keepdims=True)
+    p = counts / samples
+    centre = (p + z ** 2 / (2 * samples)) / (1 + z ** 2 / samples)
+    half_width = z * np.sqrt(p * (1 - p) / samples + z ** 2 / (4 * samples ** 2)) / (1 + z ** 2 / samples)
+    return centre - half_width, centre + half_width
+
+
+def finishing_probabilities(matches, remaining, samples=1_000_000, probabilities=MATCH_PROBABILITIES,
+                            memory_budget=MEMORY_BUDGET, seed=None):
+    # Team names in table order, and (team, position) arrays of each team's chance of finishing in each
+    # position with the lower and upper ends of its 95% confidence interval
+    table, counts = simulate_finishes(matches, remaining, samples, probabilities, memory_budget, seed)
+    order = table.ranked()
+    counts = counts[order]
+    lower, upper = confidence_intervals(counts)
+    return [table.teams[team] for team in order], counts / samples, lower, upper
+
+
+def print_finishing_probabilities(matches, remaining, samples=1_000_000, probabilities=MATCH_PROBABILITIES,
+                                  memory_budget=MEMORY_BUDGET, seed=None):
+    teams, probability, lower, upper = finishing_probabilities(matches, remaining, samples, probabilities,
+                                                               memory_budget, seed)
+    print(f"Finishing position chances (%) from {samples:,} simulated seasons")
+    print("Under each team, the lower and upper ends of each chance's 95% confidence interval")
+    print(f"{'Team':<22} " + " ".join(f"{position:>6}" for position in range(1, len(teams) + 1)))
+    for team, row, row_lower, row_upper in zip(teams, probability, lower, upper):
+        print(f"{team:<22} " + " ".join(f"{chance * 100:>6.2f}" if chance else f"{'-':>6}" for chance in row))
+        print(f"{'  95% low':<22} " + " ".join(f"{bound * 100:>6.2f}" for bound in row_lower))
+        print(f"{'  95% high':<22} " + " ".join(f"{bound * 100:>6.2f}" for bound in row_upper))
@@ -0,0 +1,669 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+
+class LeagueTable:
+    # The table as flat lists: teams are interned to indices in the order they're first seen, and
+    # points, goal difference, goals scored and games played are aggregated from the completed matches
+    # once, so anything working out outcomes only has to add its own points on top of them
+    def __init__(self, matches):
+        self.teams = []
+        self.index = {}
+        self.points = []
+        self.goal_difference = []
+        self.goals_scored = []
+        self.games_played = []
+        for home_team, (home_score, away_score), away_team in matches:
+            home = self.team_index(home_team)
+            away = self.team_index(away_team)
+            self.games_played[home] += 1
+            self.games_played[away] += 1
+            self.goals_scored[home] += home_score
+            self.goals_scored[away] += away_score
+            self.goal_difference[home] += home_score - away_score
+            self.goal_difference[away] += away_score - home_score
+            if home_score > away_score:
+                self.points[home] += 3
+            elif home_score < away_score:
+                self.points[away] += 3
+            else:
+                self.points[home] += 1
+                self.points[away] += 1
+
+    def team_index(self, team):
+        if team not in self.index:
+            self.index[team] = len(self.teams)
+            self.teams.append(team)
+            for column in (self.points, self.goal_difference, self.goals_scored, self.games_played):
+                column.append(0)
+        return self.index[team]
+
+    def fixtures(self, remaining):
+        # Remaining [home, away] name pairs as (home, away) index pairs
+        return [(self.team_index(home), self.team_index(away)) for home, away in remaining]
+
+    def ranked(self):
+        # Team indices by points, goal difference, then goals scored
+        return sorted(range(len(self.teams)),
+                      key=lambda t: (self.points[t], self.goal_difference[t], self.goals_scored[t]), reverse=True)
+
+
+# Nodes results_fit's first attempt may explore before it starts again in another order
+RESTART_NODES = 64
+# Weights _weighted_excess tries for each team: 0 and this many powers of 2
+WEIGHT_LEVELS = 4
+# Results _walk_results may change for every node of the search attempt before it, and how often it
+# makes any change that helps the team it picked rather than the best one
+WALK_CHANGES = 100
+WALK_NOISE = 0.35
+
+
+class FlowNetwork:
+    # Dinic's max-flow over an adjacency list of [target, remaining capacity, index of the reverse edge]
+    def __init__(self, size):
+        self.edges = [[] for _ in range(size)]
+
+    def add_edge(self, source, target, capacity):
+        self.edges[source].append([target, capacity, len(self.edges[target])])
+        self.edges[target].append([source, 0, len(self.edges[source]) - 1])
+
+    def _levels(self, source):
+        level = [-1] * len(self.edges)
+        level[source] = 0
+        queue = [source]
+        for node in queue:
+            for target, capacity, _ in self.edges[node]:
+                if capacity > 0 and level[target] < 0:
+                    level[target] = level[node] + 1
+                    queue.append(target)
+        return level
+
+    def _push(self, node, sink, amount, level, progress):
+        if node == sink:
+            return amount
+        edges = self.edges[node]
+        while progress[node] < len(edges):
+            edge = edges[progress[node]]
+            target, capacity, reverse = edge
+            if capacity > 0 and level[target] == level[node] + 1:
+                pushed = self._push(target, sink, min(amount, capacity), level, progress)
+                if pushed:
+                    edge[1] -= pushed
+                    self.edges[target][reverse][1] += pushed
+                    return pushed
+            progress[node] += 1
+        return 0
+
+    def max_flow(self, source, sink):
+        total = 0
+        while True:
+            level = self._levels(source)
+            if level[sink] < 0:
+                return total
+            progress = [0] * len(self.edges)
+            pushed = self._push(source, sink, float("inf"), level, progress)
+            while pushed:
+                total += pushed
+                pushed = self._push(source, sink, float("inf"), level, progress)
+
+
+@dataclass
+class SearchStats:
+    # Nodes the searches visited, and how many of them a bound or an earlier failure cut short
+    explored: int = 0
+    pruned: int = 0
+
+    def add(self, other):
+        self.explored += other.explored
+        self.pruned += other.pruned
+
+
+def _points_network(games, limits, per_game):
+    # Each game hands per_game units to its two teams, split any way between them, and each team passes
+    # on no more than its limit. Teams are indices into limits. Nodes: 0 source, 1 sink, then the
+    # games, then the teams - so the edges out of game g's node are its reverse edge, home, then away
+    teams = 2 + len(games)
+    network = FlowNetwork(teams + len(limits))
+    for g, (home, away) in enumerate(games):
+        network.add_edge(0, 2 + g, per_game)
+        network.add_edge(2 + g, teams + home, per_game)
+        network.add_edge(2 + g, teams + away, per_game)
+    for team, limit in enumerate(limits):
+        network.add_edge(teams + team, 1, limit)
+    return network
+
+
+def points_flow(games, limits, per_game, whole_games=False):
+    # The most points the games can hand out to their teams when each gives per_game points, split any
+    # way between its two teams (or all to one of them, with whole_games), and no team takes more than
+    # its limit
+    unit = per_game if whole_games else 1
+    network = _points_network(games, [limit // unit for limit in limits], per_game // unit)
+    return network.max_flow(0, 1) * unit
+
+
+def _most_share(limit, count):
+    # Doubled, the most a team can take of its games' points when each draw is counted as 1.5 points
+    # (half of the point a draw hands out less than a win goes to each team) without going over limit
+    return max(6 * wins + 3 * min(count - wins, limit - 3 * wins) for wins in range(min(count, limit // 3) + 1))
+
+
+def _reachable(target, count):
+    # The fewest points of at least target a team can take from count games
+    wins, remainder = divmod(target, 3)
+    return target if wins + remainder <= count else 3 * (wins + 1)
+
+
+def _weighted_excess(games, limits, levels=WEIGHT_LEVELS):
+    # The most by which the points the games have to hand out outweigh the limits, with every team's
+    # points weighted by 0 or a power of 2 below 2 ** levels: a game between teams weighted y and z
+    # hands out at least min(3y, 3z, y + z) weighted points, so if that's more than the weighted limits
+    # add up to, no results fit. This is the bound you'd get by letting games end part won, part drawn,
+    # whose certificates only ever weight teams 0 or a power of 2 apart. Each team's weight is a label
+    # from 0 (the heaviest) to levels (weight 0), and as what a game hands out is supermodular in its
+    # teams' labels the best labelling is one min cut, over a chain of nodes per team that is cut at
+    # its label (Ishikawa's construction)
+    weights = [2 ** (levels - 1 - label) for label in range(levels)] + [0]
+    # Negated, so the min cut minimises the weighted limits less what the games hand out
+    cost = [[-(2 * weights[a] if a == b else 3 * min(weights[a], weights[b])) for b in range(levels + 1)]
+            for a in range(levels + 1)]
+    steps = [cost[label][0] - cost[label - 1][0] for label in range(levels + 1)]
+    mixed = [(label, other, cost[label][other] - cost[label - 1][other] - cost[label][other - 1]
+              + cost[label - 1][other - 1]) for label in range(1, levels + 1) for other in range(1, levels + 1)]
+    mixed = [term for term in mixed if term[2]]
+    # Node 2 + team * levels + label - 1 is on the source side when the team's label is at least label
+    single = {}
+    double = {}
+    constant = sum(limits) * weights[0] + len(games) * cost[0][0]
+    for home, away in games:
+        for label in range(1, levels + 1):
+            single[home, label] = single.get((home, label), 0) + steps[label]
+            single[away, label] = single.get((away, label), 0) + steps[label]
+        for label, other, term in mixed:
+            single[home, label] += term
+            double[home, label, away, other] = double.get((home, label, away, other), 0) - term
+    for team, limit in enumerate(limits):
+        for label in range(1, levels + 1):
+            single[team, label] = single.get((team, label), 0) + limit * (weights[label] - weights[label - 1])
+    network = FlowNetwork(2 + len(limits) * levels)
+    for (team, label), term in single.items():
+        if term > 0:
+            network.add_edge(2 + team * levels + label - 1, 1, term)
+        elif term < 0:
+            constant += term
+            network.add_edge(0, 2 + team * levels + label - 1, -term)
+    for (home, label, away, other), term in double.items():
+        network.add_edge(2 + home * levels + label - 1, 2 + away * levels + other - 1, term)
+    # A team's label can't be at least label + 1 without being at least label
+    chain = sum(map(abs, single.values())) + sum(double.values()) + 1
+    for team in range(len(limits)):
+        for label in range(1, levels):
+            network.add_edge(2 + team * levels + label, 2 + team * levels + label - 1, chain)
+    return -(constant + network.max_flow(0, 1))
+
+
+def _can_stay_under(games, limits, counts):
+    # (verdict, branch): the verdict is None when it can't be settled without searching, and then branch
+    # is a game to search on and its results, as (home points, away points), in the order to try them
+    if min(limits, default=0) < 0:
+        return False, None
+    # Necessary: a team can't avoid defeat in more games than it has points to spare, and every defeat is
+    # a 3 point game rather than a 2 point draw. Teams with room to spare would hide a shortfall among
+    # the rest, so it's checked for the teams with the least room and the games between them, adding
+    # teams one at a time
+    order = sorted(range(len(limits)), key=lambda team: limits[team] - counts[team])
+    added = [False] * len(limits)
+    opponents = [[] for _ in limits]
+    for home, away in games:
+        opponents[home].append(away)
+        opponents[away].append(home)
+    inside = [0] * len(limits)
+    played = defeats = room = 0
+    for team in order:
+        added[team] = True
+        for other in opponents[team]:
+            if added[other]:
+                played += 1
+                for t in (team, other):
+                    defeats -= max(0, inside[t] - limits[t])
+                    room -= min(limits[t], 3 * inside[t])
+                    inside[t] += 1
+                    defeats += max(0, inside[t] - limits[t])
+                    room += min(limits[t], 3 * inside[t])
+        if 2 * played + defeats > room:
+            return False, None
+    # Sufficient: drawing every game
+    if defeats == 0:
+        return True, None
+    # Necessary: the games hand out 3 points each less 1 for every draw, and every team's share of that,
+    # draws counted as 1.5 each, has to fit under its limit - so with points doubled, the 6 a game has to
+    # fit under the most each team can take
+    if points_flow(games, [_most_share(limit, count) for count, limit in zip(counts, limits)], 6) < 6 * len(games):
+        return False, None
+    # Necessary: even a draw hands out 2 points, so every game's 2 must fit under the limits
+    network = _points_network(games, limits, 2)
+    if network.max_flow(0, 1) < 2 * len(games):
+        return False, None
+    # Sufficient: topped up to 3 points a game wherever they fit (which never takes a game below 2),
+    # every game's split is no more than a result gives - 3-0, or a draw for 2-1 and 1-1 - unless it's
+    # been split 2-0
+    for g in range(len(games)):
+        network.edges[0][g][1] += 1
+        for edge in network.edges[2 + g][1:]:
+            edge[1] += 1
+    network.max_flow(0, 1)
+    split = None
+    for g in range(len(games)):
+        home_points, away_points = (3 - capacity for _, capacity, _ in network.edges[2 + g][1:])
+        if home_points + away_points == 2 and home_points != away_points:
+            split = g, home_points > away_points
+            break
+    if split is None:
+        return True, None
+    # Necessary, and the strongest of them but the dearest, so only now it's needed to avoid a search
+    if _weighted_excess(games, limits) > 0:
+        return False, None
+    # A team with no points to spare has to lose, so its games go first
+    for g, (home, away) in enumerate(games):
+        if limits[home] == 0:
+            return None, (g, [(0, 3), (1, 1), (3, 0)])
+        if limits[away] == 0:
+            return None, (g, [(3, 0), (1, 1), (0, 3)])
+    # Otherwise the game split 2-0, drawn first and then won by whichever team the flow gave 2
+    g, home_got_more = split
+    return None, (g, [(1, 1), (3, 0), (0, 3)] if home_got_more else [(1, 1), (0, 3), (3, 0)])
+
+
+def _can_reach(games, limits, counts):
+    # (verdict, branch) as for _can_stay_under
+    needed = sum(limits)
+    if needed == 0:
+        return True, None
+    if any(limit > 3 * count for count, limit in zip(counts, limits)):
+        return False, None
+    # Necessary: the games hand out 3 points each less 1 for every draw, and a team whose target isn't a
+    # multiple of 3 either draws to hit it or goes past it - costing at least half a point for each
+    # point of the remainder. So with points doubled, every team has to be able to take twice its target
+    # (rounded up to a total its games can give) plus the remainder from the 6 a game
+    doubled = [2 * target + target % 3 for target in map(_reachable, limits, counts)]
+    if points_flow(games, doubled, 6) < sum(doubled):
+        return False, None
+    # With 3 points a game to split as we like, which after that always reaches every target
+    network = _points_network(games, limits, 3)
+    network.max_flow(0, 1)
+    # Sufficient: enough whole wins for every team, rounding each target up to a multiple of 3
+    wins = [-(-limit // 3) * 3 for limit in limits]
+    if points_flow(games, wins, 3, whole_games=True) == sum(wins):
+        return True, None
+    # Sufficient: the flow's own split of every game is (or falls short of) a result, i.e. no game has
+    # been split 2-1
+    split = None
+    for g in range(len(games)):
+        home_points, away_points = (3 - capacity for _, capacity, _ in network.edges[2 + g][1:])
+        if home_points and away_points and max(home_points, away_points) > 1:
+            split = g, home_points > away_points
+            break
+    if split is None:
+        return True, None
+    # A team that can't drop a point without falling short has to win, so its games go first
+    for g, (home, away) in enumerate(games):
+        if limits[home] and limits[home] >= 3 * counts[home] - 1:
+            return None, (g, [(3, 0), (1, 1), (0, 3)])
+        if limits[away] and limits[away] >= 3 * counts[away] - 1:
+            return None, (g, [(0, 3), (1, 1), (3, 0)])
+    # Otherwise the game split 2-1, won first by whichever team the flow gave 2
+    g, home_got_more = split
+    return None, (g, [(3, 0), (1, 1), (0, 3)] if home_got_more else [(0, 3), (1, 1), (3, 0)])
+
+
+class _OutOfNodes(Exception):
+    pass
+
+
+def results_fit(games, limits, at_most, stats=None, failed=None):
+    # Whether the games (pairs of team indices) can be given results (win 3-0, draw 1-1) so that every
+    # team in limits ends with at most (or, with at_most=False, at least) its limit in points from them.
+    # With 3 points for a win this is NP-complete in general, so it is decided by max-flow and per-team
+    # bounds wherever they settle it, and by a depth-first search over the results of the games left,
+    # cut short by the same bounds, where they don't. failed holds the states that couldn't be fitted,
+    # by the original team indices, so it can be shared by calls with the same at_most.
+    # How long the search takes swings wildly with the order it tries things in - a few dozen nodes for
+    # most orders, tens of thousands for the odd one - so it is restarted in a different (but always the
+    # same) order whenever it runs through its node budget, with the budget doubled each time. The
+    # states it has ruled out carry over, as they were ruled out in full
+    stats = stats if stats is not None else SearchStats()
+    failed = failed if failed is not None else set()
+    budget = RESTART_NODES
+    attempt = 0
+    while True:
+        try:
+            return _search_results(games, limits, at_most, stats, failed, attempt, budget)
+        except _OutOfNodes:
+            if _walk_results(games, limits, at_most, WALK_CHANGES * budget, attempt):
+                return True
+            attempt += 1
+            budget *= 2
+
+
+def _walk_results(games, limits, at_most, changes, seed):
+    # Looks for results that fit by local search rather than proving anything: from every game drawn,
+    # it keeps picking a team on the wrong side of its limit and changing one of its games in its
+    # favour - the change that leaves the fewest points on the wrong side in all, or now and then any
+    # of them, so it can't get stuck going round in circles. True if it gets there within `changes`
+    side = 1 if at_most else -1
+    shuffle = random.Random(seed)
+    # How many points each team is over its limit (or short of it), and each game's result as an index
+    # into outcomes
+    outcomes = ((3, 0), (1, 1), (0, 3))
+    over = {team: -side * limit for team, limit in limits.items()}
+    played = {team: [] for team in limits}
+    for g, (home, away) in enumerate(games):
+        over[home] += side
+        over[away] += side
+        played[home].append(g)
+        played[away].append(g)
+    results = [1] * len(games)
+    stuck = [team for team in limits if over[team] > 0]
+    for _ in range(changes):
+        if not stuck:
+            return True
+        team = shuffle.choice(stuck)
+        moves = []
+        for g in played[team]:
+            home, away = games[g]
+            ours, other = (0, away) if home == team else (1, home)
+            now = outcomes[results[g]]
+            for result, outcome in enumerate(outcomes):
+                change = side * (outcome[ours] - now[ours])
+                if change >= 0:
+                    continue
+                other_change = side * (outcome[1 - ours] - now[1 - ours])
+                worse = (max(0, over[team] + change) - over[team]
+                         + max(0, over[other] + other_change) - max(0, over[other]))
+                moves.append((worse, g, result, other, change, other_change))
+        if not moves:
+            return False
+        if shuffle.random() >= WALK_NOISE:
+            least = min(move[0] for move in moves)
+            moves = [move for move in moves if move[0] == least]
+        _, g, results[g], other, change, other_change = shuffle.choice(moves)
+        over[team] += change
+        over[other] += other_change
+        stuck = [team for team in limits if over[team] > 0]
+    return not stuck
+
+
+def _search_results(games, limits, at_most, stats, failed, attempt, budget):
+    # One attempt of results_fit, raising _OutOfNodes once it has explored budget nodes. The first
+    # attempt takes the games and teams in the order given, the rest in an order shuffled by attempt
+    counts = dict.fromkeys(limits, 0)
+    for home, away in games:
+        counts[home] += 1
+        counts[away] += 1
+    shuffle = random.Random(attempt) if attempt else None
+    if shuffle:
+        games = [(away, home) if shuffle.random() < 0.5 else (home, away) for home, away in games]
+        shuffle.shuffle(games)
+    # Renumbered from the tightest team up (ties broken at random after the first attempt), and the
+    # tightest teams' games first, so they are settled early on and stop mattering to the rest
+    if at_most:
+        tightness = {team: limits[team] - counts[team] for team in limits}
+    else:
+        tightness = {team: 3 * counts[team] - limits[team] for team in limits}
+    order = sorted(limits, key=lambda team: (tightness[team], shuffle.random() if shuffle else 0))
+    local = {team: i for i, team in enumerate(order)}
+    games = [(local[home], local[away]) for home, away in games]
+    if not shuffle:
+        games.sort()
+    games.sort(key=lambda game: (min(game), max(game)))
+    # Which way round a game is played makes no difference to the points, so in the memo it's by the
+    # original indices of its teams, lowest first
+    originals = [tuple(sorted((order[home], order[away]))) for home, away in games]
+    limits = [limits[team] if at_most else max(0, limits[team]) for team in order]
+    quick_check = _can_stay_under if at_most else _can_reach
+    explored = 0
+
+    # remaining is a tuple of indices into games. The results are applied to limits in place and taken
+    # off again on the way back
+    def search(remaining):
+        nonlocal explored
+        if explored == budget:
+            raise _OutOfNodes
+        explored += 1
+        stats.explored += 1
+        current = [games[g] for g in remaining]
+        left = [0] * len(limits)
+        for home, away in current:
+            left[home] += 1
+            left[away] += 1
+        verdict, branch = quick_check(current, limits, left)
+        if verdict is not None:
+            stats.pruned += not verdict
+            return verdict
+        # Only the teams with games left matter, and room for more points than a team's games can still
+        # give it is the same as having just enough
+        if at_most:
+            state = ((order[team], min(limit, 3 * count)) for team, (limit, count) in enumerate(zip(limits, left)))
+        else:
+            state = ((order[team], limit) for team, (limit, count) in enumerate(zip(limits, left)))
+        key = (tuple(sorted(originals[g] for g in remaining)),
+               tuple(sorted((team, limit) for (team, limit), count in zip(state, left) if count)))
+        if key in failed:
+            stats.pruned += 1
+            return False
+        branch, outcomes = branch
+        home, away = current[branch]
+        rest = remaining[:branch] + remaining[branch + 1:]
+        home_limit, away_limit = limits[home], limits[away]
+        for home_points, away_points in outcomes:
+            if at_most:
+                limits[home] = home_limit - home_points
+                limits[away] = away_limit - away_points
+            else:
+                limits[home] = max(0, home_limit - home_points)
+                limits[away] = max(0, away_limit - away_points)
+            fits = search(rest)
+            limits[home], limits[away] = home_limit, away_limit
+            if fits:
+                return True
+        failed.add(key)
+        return False
+
+    return search(tuple(range(len(games))))
+
+
+def fewest_left_out(candidates, fits):
+    # The fewest candidates to leave out so that fits(the rest) is true, where whatever fits still fits
+    # with any candidate taken out. Every set that doesn't fit is shrunk to a core of candidates that
+    # can't all be in together, and only the sets that leave out at least one of every core found so
+    # far are tried - from leaving out none upwards, so the first that fits is the answer. candidates
+    # are in the order to try leaving them out
+    cores = []
+    fitting = []
+
+    def check(included):
+        # Built up a candidate at a time, so a set that doesn't fit is caught by the fewest candidates
+        # it can be: proving that many loosely bound teams don't fit takes far longer than proving it
+        # for the tight few among them
+        if any(core <= included for core in cores):
+            return False
+        if any(included <= fit for fit in fitting):
+            return True
+        grown = frozenset()
+        for team in candidates:
+            if team not in included:
+                continue
+            grown = grown | {team}
+            if any(core <= grown for core in cores):
+                return False
+            if not any(grown <= fit for fit in fitting) and not fits(grown):
+                cores.append(shrink(grown))
+                return False
+        fitting.append(included)
+        return True
+
+    def shrink(included):
+        # Taking out the candidates least likely to be left out first, whatever isn't needed to keep it
+        # from fitting
+        for team in reversed(candidates):
+            if team in included and not check(included - {team}):
+                included = included - {team}
+        return included
+
+    def leave_out(left_out, tried, size):
+        unhit = next((core for core in cores if not core & left_out), None)
+        if unhit is None:
+            if check(frozenset(candidates) - left_out):
+                return True
+            unhit = next(core for core in cores if not core & left_out)
+        if len(left_out) == size:
+            return False
+        # Leaving out each of the core in turn, and not again in the branches after its own
+        tried = set(tried)
+        for team in candidates:
+            if team in unhit and team not in tried:
+                if leave_out(left_out | {team}, tried, size):
+                    return True
+                tried.add(team)
+        return False
+
+    for size in range(len(candidates) + 1):
+        if leave_out(frozenset(), frozenset(), size):
+            return size
+
+
+def _games_left(fixtures, size):
+    counts = [0] * size
+    for home, away in fixtures:
+        counts[home] += 1
+        counts[away] += 1
+    return counts
+
+
+def _target_keeps_tie(table, games_left, target, team, best_case):
+    # Level on points, goal difference decides - and a team with a game left can win or lose it by any
+    # margin, so the tie goes whichever way the case we're solving wants. Otherwise it is decided by the
+    # goal difference and goals scored they already have
+    if games_left[target] or games_left[team]:
+        return best_case
+    ours = (table.goal_difference[target], table.goals_scored[target])
+    theirs = (table.goal_difference[team], table.goals_scored[team])
+    return ours > theirs or (ours == theirs and best_case)
+
+
+def best_position(table, target, fixtures, stats=None):
+    # Best finish for the team with index target, given the table and its remaining (home, away) fixtures
+    games_left = _games_left(fixtures, len(table.teams))
+    # The target wins every game it has left, which also keeps its opponents' points down
+    target_points = table.points[target] + 3 * games_left[target]
+
+    # Points each other team can still add and stay below the target; those already past it are above
+    # whatever happens, and win all their games against everyone else
+    above = 0
+    room = {}
+    for team in range(len(table.teams)):
+        if team == target:
+            continue
+        limit = target_points if _target_keeps_tie(table, games_left, target, team, True) else target_points - 1
+        if table.points[team] > limit:
+            above += 1
+        else:
+            room[team] = limit - table.points[team]
+    games = [(home, away) for home, away in fixtures if home in room and away in room]
+
+    # The fewest teams that have to be let past: each one let past wins its games against the rest,
+    # so only the games between the teams kept below matter. Teams with the least room are let past first
+    failed = set()
+
+    def fits(kept):
+        between = [game for game in games if game[0] in kept and game[1] in kept]
+        return results_fit(between, {team: room[team] for team in kept}, at_most=True, stats=stats, failed=failed)
+
+    return 1 + above + fewest_left_out(sorted(room, key=lambda team: room[team]), fits)
+
+
+def worst_position(table, target, fixtures, stats=None):
+    # Worst finish for the team with index target, given the table and its remaining (home, away) fixtures
+    games_left = _games_left(fixtures, len(table.teams))
+    # The target loses every game it has left, which also hands its opponents 3 points each
+    target_points = table.points[target]
+    beat_target = _games_left([game for game in fixtures if target in game], len(table.teams))
+
+    # Points each other team still needs to finish above the target; teams already there count as above
+    above = 0
+    needed = {}
+    for team in range(len(table.teams)):
+        if team == target:
+            continue
+        limit = target_points + 1 if _target_keeps_tie(table, games_left, target, team, False) else target_points
+        need = limit - table.points[team] - 3 * beat_target[team]
+        if need <= 0:
+            above += 1
+        elif need <= 3 * (games_left[team] - beat_target[team]):
+            needed[team] = need
+    games = [(home, away) for home, away in fixtures if home in needed and away in needed]
+    against = [left - beaten for left, beaten in zip(games_left, beat_target)]
+
+    # The most teams that can get past: those left behind lose their games against the ones getting
+    # past, so each of those only needs its remaining points from games between themselves. Teams that
+    # need the most are left behind first
+    failed = set()
+
+    def fits(passing):
+        between = [game for game in games if game[0] in passing and game[1] in passing]
+        inside = _games_left(between, len(table.teams))
+        limits = {team: needed[team] - 3 * (against[team] - inside[team]) for team in passing}
+        return results_fit(between, limits, at_most=False, stats=stats, failed=failed)
+
+    return 1 + above + len(needed) - fewest_left_out(sorted(needed, key=lambda team: -needed[team]), fits)
+
+
+# A worker process's own table and fixtures, built once by _start_worker from the matches it is
+# started with, rather than sent along with every search
+_worker_table = None
+_worker_fixtures = None
+
+
+def _start_worker(matches, remaining):
+    global _worker_table, _worker_fixtures
+    _worker_table = LeagueTable(matches)
+    _worker_fixtures = _worker_table.fixtures(remaining)
+
+
+def _search_position(job):
+    # One team's best (or worst) finish, with what it took to find it
+    team, best_case = job
+    stats = SearchStats()
+    solve = best_position if best_case else worst_position
+    return solve(_worker_table, team, _worker_fixtures, stats), stats
+
+
+def create_league_table_and_print(matches, remaining, workers=None):
+    # Every team's best and worst finish are separate searches, spread over `workers` processes (None
+    # for one per CPU, 1 to search in this process). Team indices come out the same in every process,
+    # as each builds its table from the same matches
+    table = LeagueTable(matches)
+    jobs = [(team, best_case) for team in range(len(table.teams)) for best_case in (True, False)]
+    if workers == 1:
+        _start_worker(matches, remaining)
+        results = list(map(_search_position, jobs))
+    else:
+        with ProcessPoolExecutor(workers, initializer=_start_worker, initargs=(matches, remaining)) as pool:
+            # In the order submitted, however they finish
+            results = list(pool.map(_search_position, jobs))
+    stats = SearchStats()
+    positions = {}
+    for job, (position, job_stats) in zip(jobs, results):
+        positions[job] = position
+        stats.add(job_stats)
+    finishes = {}
+    for team in range(len(table.teams)):
+        best, worst = positions[team, True], positions[team, False]
+        finishes[team] = f"{best}-{worst}" if best != worst else f"{best}"
+    # Print table
+    print(f"{'Pos':<3} {'Team':<22} {'Points':<6} {'GD':<4} {'GS':<4} {'GP':<4} {'Possible Finishes':<17}")
+    for position, team in enumerate(table.ranked(), 1):
+        print(f"{position:<2}  {table.teams[team]:<22} {table.points[team]:<6} {table.goal_difference[team]:<4} "
+              f"{table.goals_scored[team]:<4} {table.games_played[team]:<4} {finishes[team]:<17}")
+    print(f"Searched {stats.explored} nodes, {stats.pruned} of them pruned")
@@ -0,0 +1,231 @@
+import email.utils
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from cache_store import CACHE_DIR, CIRCUIT_OPEN_HEADER, CORRUPT_BODY_ERRORS, NEGATIVE_STATUSES, PROXY_PREFIX, \
+    STORE_BACKENDS, UPSTREAM_PREFIX, read_cached_json
+
+run_in_terminal = "mitmproxy -s cacher_forever.py --mode reverse:http://www.sofascore.com --listen-port 8080"
+
+# cache-only: never touches the network, proxy: cache first then through the caching proxy,
+# direct: straight to sofascore with no cache at all
+MODES = ["cache-only", "proxy", "direct"]
+# The cache backend the proxy runs with (--set cache_backend=...), which the scripts read the cache from
+CACHE_BACKEND = "file"
+
+# Responses worth asking for again: being told to slow down, or the proxy or sofascore having a moment.
+# A 403 isn't one - sofascore blocks for far longer than a retry would wait
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+# Parsed responses by URL for the whole run, shared by every client in the process, so each resource
+# is read and parsed at most once however many times a script asks for it. Callers mustn't modify them
+_parsed = {}
+# (mode, URL) of responses try_get_json found missing, so they aren't asked for again either
+_missing = set()
+
+
+def retry_after_seconds(response):
+    # Retry-After is either a number of seconds or an HTTP date; None if it is missing or unreadable
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class RequestBudget:
+    # Shared by every thread using a client: at most `concurrency` requests in flight at once, started
+    # no faster than rate_per_minute (0 for no limit), in the order they asked
+    def __init__(self, concurrency: int, rate_per_minute: int = 0):
+        self.slots = threading.BoundedSemaphore(concurrency)
+        self.interval = 60 / rate_per_minute if rate_per_minute > 0 else 0
+        self.next_start = 0.0
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        self.slots.acquire()
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+    def __exit__(self, *exc_info):
+        self.slots.release()
+
+
+class SofascoreClient:
+    # What the scripts fetch through: API paths like "api/v1/team/42/players" in, parsed JSON out.
+    # One keep-alive session for the whole run, and one cache lookup per URL before any request
+    def __init__(self, mode: str = "proxy", cache_dir: str = CACHE_DIR, workers: int = 8, rate_per_minute: int = 0,
+                 max_attempts: int = 4, backoff: float = 1.0, max_backoff: float = 30.0,
+                 backend: str = CACHE_BACKEND):
+        if mode not in MODES:
+            raise ValueError(f"Unknown client mode {mode!r}, expected one of {', '.join(MODES)}")
+        if backend not in STORE_BACKENDS:
+            raise ValueError(f"Unknown cache backend {backend!r}, expected one of {', '.join(STORE_BACKENDS)}")
+        self.mode = mode
+        self.cache_dir = cache_dir
+        self.backend = backend
+        self.prefix = UPSTREAM_PREFIX if mode == "direct" else PROXY_PREFIX
+        self.workers = workers
+        self.budget = RequestBudget(workers, rate_per_minute)
+        self.session = requests.Session()
+        # Enough pooled connections for every worker, so none of them opens a connection of its own
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        # Paths that weren't in the cache and had to be requested
+        self.downloads = 0
+        self.downloads_lock = threading.Lock()
+
+    def _cached(self, path):
+        # This run's copy, then the cache. Through the proxy, entries it would refetch are left to it, so
+        # the scripts see the same FRESHNESS_RULES; cache-only uses whatever is cached however old
+        url = self.prefix + path
+        data = _parsed.get(url)
+        if data is not None or self.mode == "direct":
+            return data
+        try:
+            data = read_cached_json(url, self.cache_dir, fresh_only=self.mode == "proxy", backend=self.backend)
+        except CORRUPT_BODY_ERRORS as e:
+            # Treated as a miss, so it is fetched again
+            print(f"[CACHE ERROR] Failed to read cached data for {path}: {e}")
+            return None
+        if data is not None:
+            _parsed[url] = data
+        return data
+
+    def _backoff_seconds(self, attempt):
+        # Doubles with every attempt up to max_backoff, half of it random so that workers that failed
+        # together don't all retry together
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def _fetch(self, path):
+        # The response once it isn't worth retrying, or the last attempt's response or connection error
+        if self.mode == "proxy":
+            print(f"Fetching {path} from network")
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                with self.budget:
+                    response = self.session.get(self.prefix + path)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_attempts:
+                    raise
+                wait = self._backoff_seconds(attempt)
+                reason = type(e).__name__
+            else:
+                if response.status_code not in RETRYABLE_STATUSES or attempt == self.max_attempts:
+                    return response
+                if CIRCUIT_OPEN_HEADER in response.headers:
+                    # The proxy's circuit breaker is open: nothing goes upstream until its cool-down is over,
+                    # which is far longer than a retry would wait, so retrying would only be refused again
+                    return response
+                wait = retry_after_seconds(response)
+                if wait is None:
+                    wait = self._backoff_seconds(attempt)
+                else:
+                    wait = min(wait, self.max_backoff)
+                reason = f"status {response.status_code}"
+            print(f"[RETRY] {path} failed ({reason}), trying again in {wait:.1f}s "
+                  f"(attempt {attempt + 1} of {self.max_attempts})")
+            # Outside the budget, so waiting out a retry doesn't hold up requests for other paths
+            time.sleep(wait)
+
+    def _download(self, path, optional):
+        url = self.prefix + path
+        if optional and (self.mode, url) in _missing:
+            return None
+        if self.mode == "cache-only":
+            if optional:
+                print(f"{path} not in cache, ignoring")
+                _missing.add((self.mode, url))
+                return None
+            raise LookupError(f"{path} is not in the cache")
+        with self.downloads_lock:
+            self.downloads += 1
+        if not optional:
+            response = self._fetch(path)
+            response.raise_for_status()
+        else:
+            try:
+                response = self._fetch(path)
+            except requests.RequestException as e:
+                print(f"Error checking {path}: {e}")
+                return None
+            if response.status_code != 200:
+                # Only remembered if it's really not there; anything else may well work next time
+                if response.status_code in NEGATIVE_STATUSES:
+                    _missing.add((self.mode, url))
+                return None
+        data = _parsed[url] = response.json()
+        return data
+
+    def get_json(self, path: str):
+        # For responses the script can't do without: raises if it isn't cached (cache-only) or isn't a 200
+        data = self._cached(path)
+        return data if data is not None else self._download(path, optional=False)
+
+    def try_get_json(self, path: str):
+        # For responses that may legitimately be missing, e.g. players without attribute overviews
+        data = self._cached(path)
+        return data if data is not None else self._download(path, optional=True)
+
+    def map_json(self, paths, optional: bool = False):
+        # get_json (or try_get_json) for every path, yielded in the order given. The cache is read on this
+        # thread; only the misses go to the worker threads, which share the client's request budget
+        pool = ThreadPoolExecutor(self.workers)
+        try:
+            pending = []
+            for path in paths:
+                data = self._cached(path)
+                pending.append(data if data is not None else pool.submit(self._download, path, optional))
+            for item in pending:
+                yield item.result() if isinstance(item, Future) else item
+        finally:
+            # Don't start the rest if one failed or the caller stopped reading
+            pool.shutdown(cancel_futures=True)
+
+    def as_completed_json(self, paths, optional: bool = False):
+        # Like map_json, but (path, JSON) pairs as soon as each is ready: cache hits straight away, then
+        # downloads in whatever order they finish
+        pool = ThreadPoolExecutor(self.workers)
+        try:
+            downloads = {}
+            for path in paths:
+                data = self._cached(path)
+                if data is not None:
+                    yield path, data
+                else:
+                    downloads[pool.submit(self._download, path, optional)] = path
+            for future in as_completed(downloads):
+                yield downloads[future], future.result()
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    def get_league_id_and_season_id(self, league_name: str):
+        league_name = league_name.replace(" ", "%20")
+        leagueid = self.get_json(f"api/v1/search/all?q={league_name}&page=0")['results'][0]['entity']['id']
+        seasonid = self.get_json(f"api/v1/unique-tournament/{leagueid}/seasons")['seasons'][0]['id']
+        return leagueid, seasonid
+
+    def close(self):
+        self.session.close()